@@ -0,0 +1,48 @@
+import pandas as pd
+
+# 통계 페이지와 API가 함께 쓰는 조회 함수들입니다. cursor 는 dictionary=True 커서여야 합니다.
+
+
+def load_registrations(cursor):
+    """전국 연간(또는 12월 말 기준) ICE/EV 등록대수를 (연도, 연료, 등록대수) 형식으로 반환합니다."""
+    cursor.execute("""
+        SELECT year, fuel_type, count
+        FROM vehicle_registrations
+        WHERE region = '전국' AND month IN (0, 12) AND fuel_type IN ('ICE', 'EV')
+        ORDER BY year, month
+    """)
+    df = pd.DataFrame(cursor.fetchall(), columns=['year', 'fuel_type', 'count'])
+    # 연간 값과 12월 값이 함께 있으면 마지막(12월) 값 사용
+    df = df.drop_duplicates(subset=['year', 'fuel_type'], keep='last')
+    df = df.rename(columns={'year': '연도', 'count': '등록대수'})
+    df['연료'] = df['fuel_type']
+    return df.sort_values(['연료', '연도'], ascending=[False, True], ignore_index=True)
+
+
+def load_fire_counts(cursor):
+    """연도별 화재 건수를 (연도, 화재 발생 수, 연료) 형식으로 반환합니다. 전체 차량 화재는 ICE로 간주합니다."""
+    cursor.execute("SELECT year, total_fires FROM total_fire_incidents")
+    total_fire_df = pd.DataFrame(cursor.fetchall(), columns=['year', 'total_fires'])
+    total_fire_df['연료'] = 'ICE'
+
+    cursor.execute("SELECT year, total_fires FROM ev_fire_cases")
+    ev_fire_df = pd.DataFrame(cursor.fetchall(), columns=['year', 'total_fires'])
+    ev_fire_df['연료'] = 'EV'
+
+    fire_df = pd.concat([total_fire_df, ev_fire_df], ignore_index=True)
+    return fire_df.rename(columns={'year': '연도', 'total_fires': '화재 발생 수'})
+
+
+def load_fire_breakdown(cursor):
+    """발생 장소별 전체 화재와 EV 인명/재산피해 컬럼을 (total_fire_df, ev_fire_df) 로 반환합니다."""
+    cursor.execute("""
+        SELECT year, total_fires, general_road, highway, other_road, parking_lot, vacant_lot, tunnel
+        FROM total_fire_incidents
+    """)
+    total_fire_df = pd.DataFrame(cursor.fetchall())
+    cursor.execute("""
+        SELECT year, total_fires, total_casualties, deaths, injuries, property_damage_krw
+        FROM ev_fire_cases
+    """)
+    ev_fire_df = pd.DataFrame(cursor.fetchall())
+    return total_fire_df, ev_fire_df
@@ -0,0 +1,133 @@
+import numpy as np
+import pandas as pd
+
+# 10만 대당 발생률
+PER_VEHICLES = 100000
+
+# DB 컬럼 → 화면 표시용 항목명
+LOCATION_COLUMNS = {
+    'total_fires': '전체',
+    'general_road': '일반도로',
+    'highway': '고속도로',
+    'other_road': '기타도로',
+    'parking_lot': '주차장',
+    'vacant_lot': '공지',
+    'tunnel': '터널',
+}
+CASUALTY_COLUMNS = {
+    'total_fires': '화재',
+    'total_casualties': '인명피해',
+    'deaths': '사망',
+    'injuries': '부상',
+}
+DAMAGE_COLUMN = 'property_damage_krw'
+
+RATE_COLUMNS = ['연도', '연료', '구분', '항목', '건수', '등록대수', '발생률',
+                '신뢰구간 하한', '신뢰구간 상한', '부트스트랩 하한', '부트스트랩 상한']
+
+
+def _melt(df, fuel, breakdown, columns):
+    present = [c for c in columns if c in df.columns]
+    long_df = df.melt(id_vars=['year'], value_vars=present, var_name='column', value_name='건수')
+    long_df['항목'] = long_df['column'].map(columns)
+    long_df['연료'] = fuel
+    long_df['구분'] = breakdown
+    return long_df.rename(columns={'year': '연도'})[['연도', '연료', '구분', '항목', '건수']]
+
+
+def fire_events_long(total_fire_df, ev_fire_df):
+    """
+    total_fire_incidents / ev_fire_cases 테이블을 (연도, 연료, 구분, 항목, 건수) 롱 포맷으로 합칩니다.
+    전체 차량 화재는 통계 페이지와 같이 ICE로 간주합니다.
+    """
+    frames = []
+    if total_fire_df is not None and not total_fire_df.empty:
+        frames.append(_melt(total_fire_df, 'ICE', '발생 장소', LOCATION_COLUMNS))
+    if ev_fire_df is not None and not ev_fire_df.empty:
+        frames.append(_melt(ev_fire_df, 'EV', '인명피해', CASUALTY_COLUMNS))
+    if not frames:
+        return pd.DataFrame(columns=['연도', '연료', '구분', '항목', '건수'])
+    events = pd.concat(frames, ignore_index=True)
+    return events.dropna(subset=['건수'])
+
+
+def calculate_fire_rates_per_registration(reg_df, fire_df):
+    """(연도, 연료)별 등록대수 10만 대당 화재 발생 횟수(화재율)를 계산합니다."""
+    if reg_df.empty or fire_df.empty:
+        return pd.DataFrame()
+
+    # 등록대수와 화재 발생 수를 병합
+    merged_df = pd.merge(reg_df, fire_df, on=['연도', '연료'], how='inner')
+
+    # 화재율 계산 (비율)
+    merged_df['화재율'] = (merged_df['화재 발생 수'] / merged_df['등록대수']) * PER_VEHICLES
+
+    return merged_df[['연도', '연료', '화재율']]
+
+
+def poisson_exact_interval(counts, alpha=0.05):
+    """관측 건수 배열에 대한 정확한(Garwood) Poisson 신뢰구간 (하한, 상한)."""
+    from scipy.special import gammaincinv  # scipy는 구간을 계산할 때만 임포트
+
+    counts = np.asarray(counts, dtype=float)
+    lower = np.where(counts > 0, gammaincinv(np.maximum(counts, 1), alpha / 2), 0.0)
+    upper = gammaincinv(counts + 1, 1 - alpha / 2)
+    return lower, upper
+
+
+def poisson_bootstrap_interval(counts, alpha=0.05, n_boot=2000, seed=0):
+    """모든 셀을 (셀 수 x n_boot) 행렬로 한 번에 재표본추출하는 parametric bootstrap 구간."""
+    counts = np.asarray(counts, dtype=float)
+    rng = np.random.default_rng(seed)
+    samples = rng.poisson(counts[:, None], size=(counts.size, n_boot))
+    lower, upper = np.percentile(samples, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=1)
+    return lower, upper
+
+
+def compute_rates(events_df, reg_df, alpha=0.05, n_boot=2000, seed=0):
+    """
+    (연도, 연료)별 등록대수로 모든 구분/항목의 10만 대당 발생률과
+    정확한 Poisson 신뢰구간, bootstrap 구간을 한 번의 벡터 연산으로 계산합니다.
+    reg_df 는 통계 페이지와 같은 (연도, 연료, 등록대수) 형식입니다.
+    관측 건수가 0인 셀은 Poisson(0) 재표본이 항상 0이라 bootstrap 구간이 [0, 0]으로 무너지므로
+    NaN 으로 비워 둡니다. (정확한 구간의 상한은 0건이어도 0보다 큽니다)
+    """
+    if events_df.empty or reg_df.empty:
+        return pd.DataFrame(columns=RATE_COLUMNS)
+
+    merged = events_df.merge(reg_df[['연도', '연료', '등록대수']], on=['연도', '연료'], how='inner')
+    counts = merged['건수'].to_numpy(dtype=float)
+    scale = PER_VEHICLES / merged['등록대수'].to_numpy(dtype=float)
+
+    exact_low, exact_high = poisson_exact_interval(counts, alpha)
+    boot_low, boot_high = poisson_bootstrap_interval(counts, alpha, n_boot, seed)
+
+    merged['발생률'] = counts * scale
+    merged['신뢰구간 하한'] = exact_low * scale
+    merged['신뢰구간 상한'] = exact_high * scale
+    observed = counts > 0
+    merged['부트스트랩 하한'] = np.where(observed, boot_low * scale, np.nan)
+    merged['부트스트랩 상한'] = np.where(observed, boot_high * scale, np.nan)
+    return merged[RATE_COLUMNS]
+
+
+def compute_damage_rates(ev_fire_df, reg_df, alpha=0.05, n_boot=2000, seed=0):
+    """
+    EV 화재 재산피해(원)의 10만 대당 금액. 건당 평균 피해액은 고정하고
+    화재 건수를 Poisson 재표본추출해 bootstrap 구간을 구합니다.
+    """
+    if ev_fire_df is None or ev_fire_df.empty or DAMAGE_COLUMN not in ev_fire_df.columns or reg_df.empty:
+        return pd.DataFrame(columns=['연도', '연료', '재산피해', '등록대수', '10만대당 피해액', '부트스트랩 하한', '부트스트랩 상한'])
+
+    damage = ev_fire_df.rename(columns={'year': '연도', DAMAGE_COLUMN: '재산피해'})
+    damage = damage.assign(연료='EV').merge(reg_df[['연도', '연료', '등록대수']], on=['연도', '연료'], how='inner')
+    fires = damage['total_fires'].to_numpy(dtype=float)
+    per_fire = np.divide(damage['재산피해'].to_numpy(dtype=float), fires, out=np.zeros_like(fires), where=fires > 0)
+    scale = PER_VEHICLES / damage['등록대수'].to_numpy(dtype=float)
+
+    boot_low, boot_high = poisson_bootstrap_interval(fires, alpha, n_boot, seed)
+    damage['10만대당 피해액'] = damage['재산피해'].to_numpy(dtype=float) * scale
+    # 화재가 0건인 해는 재표본도 0이라 구간이 무너지므로 비워 둡니다.
+    damage['부트스트랩 하한'] = np.where(fires > 0, boot_low * per_fire * scale, np.nan)
+    damage['부트스트랩 상한'] = np.where(fires > 0, boot_high * per_fire * scale, np.nan)
+    return damage[['연도', '연료', '재산피해', '등록대수', '10만대당 피해액', '부트스트랩 하한', '부트스트랩 상한']]
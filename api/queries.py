@@ -0,0 +1,109 @@
+import base64
+import hashlib
+import json
+
+from analytics import fire_data
+from analytics.fire_rates import calculate_fire_rates_per_registration, compute_rates, fire_events_long
+
+# --- 설정 ---
+# FAQ 목록 응답의 기본/최대 페이지 크기
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+# 데이터 버전(ETag) 계산에 쓰는 테이블
+FIRE_TABLES = ['vehicle_registrations', 'total_fire_incidents', 'ev_fire_cases']
+FAQ_TABLES = ['EV_Manufacturer', 'EV_Manufacturer_FAQ']
+
+
+# --- 데이터 버전 / ETag ---
+def data_version(cursor, tables):
+    """테이블 체크섬을 이어 붙인 데이터 버전. 적재로 내용이 바뀌면 값이 바뀝니다. (dictionary 커서)"""
+    cursor.execute("CHECKSUM TABLE " + ", ".join(tables))
+    return '-'.join(str(row['Checksum']) for row in cursor.fetchall())
+
+
+def make_etag(version, uri):
+    """데이터 버전과 요청 URI(쿼리 포함)로 만든 강한 ETag."""
+    return '"' + hashlib.sha1(f"{version}\x1f{uri}".encode('utf-8')).hexdigest() + '"'
+
+
+# --- 커서 페이지네이션 ---
+def encode_cursor(last_id):
+    return base64.urlsafe_b64encode(json.dumps({'after': last_id}).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """encode_cursor 로 만든 토큰에서 마지막 id 를 꺼냅니다. 잘못된 토큰이면 ValueError."""
+    if not token:
+        return 0
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        after = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))['after']
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"잘못된 cursor 입니다: {token}") from e
+    if not isinstance(after, int) or after < 0:
+        raise ValueError(f"잘못된 cursor 입니다: {token}")
+    return after
+
+
+def parse_page_args(cursor_token, limit):
+    """요청 인자(cursor, limit 문자열)를 (after_id, limit)로 바꿉니다. limit 은 1~MAX_PAGE_SIZE 로 맞춥니다."""
+    after_id = decode_cursor(cursor_token)
+    if limit is None or limit == '':
+        return after_id, DEFAULT_PAGE_SIZE
+    try:
+        limit = int(limit)
+    except (TypeError, ValueError):
+        raise ValueError(f"limit 은 정수여야 합니다: {limit}") from None
+    return after_id, max(1, min(limit, MAX_PAGE_SIZE))
+
+
+def _like_pattern(text):
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+def fetch_faq_page(cursor, after_id=0, limit=DEFAULT_PAGE_SIZE, query=None, manufacturer=None):
+    """
+    id 기준 keyset 페이지네이션으로 FAQ를 가져옵니다. (OFFSET 없이 id > 마지막 id 부터 읽습니다.)
+    반환값은 (FAQ dict 목록, 다음 페이지 cursor 또는 None) 입니다.
+    """
+    conditions = ["faq.id > %s"]
+    params = [after_id]
+    if query:
+        conditions.append("(faq.question LIKE %s OR faq.answer LIKE %s)")
+        params += [_like_pattern(query)] * 2
+    if manufacturer:
+        conditions.append("m.name = %s")
+        params.append(manufacturer)
+
+    # 한 건 더 읽어서 다음 페이지가 있는지 확인
+    cursor.execute(f"""
+        SELECT faq.id, m.name AS manufacturer_name, faq.question, faq.answer,
+               faq.cluster_id, faq.version, faq.captured_at
+        FROM EV_Manufacturer_FAQ faq
+        JOIN EV_Manufacturer m ON faq.manufacturer_id = m.id
+        WHERE {' AND '.join(conditions)}
+        ORDER BY faq.id
+        LIMIT %s
+    """, params + [limit + 1])
+    rows = cursor.fetchall()
+    next_cursor = encode_cursor(rows[limit - 1]['id']) if len(rows) > limit else None
+    return rows[:limit], next_cursor
+
+
+# --- 화재율 ---
+def _records(df):
+    """DataFrame → JSON 직렬화 가능한 dict 목록 (numpy 타입, NaN 변환)."""
+    return json.loads(df.to_json(orient='records', force_ascii=False))
+
+
+def fetch_fire_rates(cursor):
+    """통계 페이지의 '등록대수 10만 건당 화재 발생 횟수' (calculate_fire_rates_per_registration 결과)."""
+    return _records(calculate_fire_rates_per_registration(fire_data.load_registrations(cursor),
+                                                          fire_data.load_fire_counts(cursor)))
+
+
+def fetch_fire_rate_intervals(cursor):
+    """구분/항목별 발생률과 Poisson 신뢰구간, bootstrap 구간."""
+    total_fire_df, ev_fire_df = fire_data.load_fire_breakdown(cursor)
+    return _records(compute_rates(fire_events_long(total_fire_df, ev_fire_df), fire_data.load_registrations(cursor)))
@@ -0,0 +1,152 @@
+import abc
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tornado.ioloop
+import tornado.web
+
+from api import queries
+from db import connection as db
+
+# --- 설정 ---
+DEFAULT_PORT = 8600
+# 같은 데이터 버전을 다시 확인하지 않고 재사용하는 시간(초). 폴링이 잦아도 체크섬은 이 주기로만 계산합니다.
+VERSION_TTL_SECONDS = 5
+# 데이터 버전별로 보관하는 응답 본문 개수
+RESPONSE_CACHE_SIZE = 256
+
+# DB 조회는 블로킹이므로 연결 풀 크기만큼의 스레드에서 실행합니다. (풀이 비어 PoolError 가 나지 않도록)
+_executor = ThreadPoolExecutor(max_workers=db.POOL_SIZE, thread_name_prefix='api-db')
+_versions = {}
+_responses = {}
+
+
+def _with_cursor(func, *args):
+    """풀에서 연결을 빌려 dictionary 커서로 func(cursor, *args)를 실행하고 연결을 돌려줍니다."""
+    conn = db.get_pooled_connection()
+    try:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            return func(cursor, *args)
+        finally:
+            cursor.close()
+    finally:
+        conn.close()
+
+
+class JsonHandler(tornado.web.RequestHandler, metaclass=abc.ABCMeta):
+    """
+    데이터 버전 기반 ETag를 붙이는 읽기 전용 JSON 핸들러.
+    If-None-Match 가 현재 버전과 같으면 본문을 만들지 않고 304를 돌려줍니다.
+    하위 클래스는 tables 와 build_payload() 를 정의합니다.
+    """
+    tables = ()
+
+    def set_default_headers(self):
+        self.set_header('Content-Type', 'application/json; charset=UTF-8')
+        # 캐시는 해도 되지만 매번 ETag로 재검증
+        self.set_header('Cache-Control', 'no-cache')
+
+    def compute_etag(self):
+        # 본문 해시 대신 get() 에서 데이터 버전으로 ETag를 붙입니다.
+        return None
+
+    async def run_query(self, func, *args):
+        return await tornado.ioloop.IOLoop.current().run_in_executor(_executor, _with_cursor, func, *args)
+
+    async def current_version(self):
+        key = tuple(self.tables)
+        cached = _versions.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        version = await self.run_query(queries.data_version, list(self.tables))
+        _versions[key] = (time.monotonic() + VERSION_TTL_SECONDS, version)
+        return version
+
+    async def get(self):
+        version = await self.current_version()
+        self.set_header('Etag', queries.make_etag(version, self.request.uri))
+        if self.check_etag_header():
+            self.set_status(304)
+            return
+
+        cached = _responses.get(self.request.uri)
+        if cached and cached[0] == version:
+            body = cached[1]
+        else:
+            payload = await self.build_payload()
+            payload['version'] = version
+            body = json.dumps(payload, ensure_ascii=False, default=str)
+            if len(_responses) >= RESPONSE_CACHE_SIZE:
+                _responses.pop(next(iter(_responses)))
+            _responses[self.request.uri] = (version, body)
+        self.write(body)
+
+    @abc.abstractmethod
+    async def build_payload(self):
+        """응답 JSON 으로 보낼 dict 를 만듭니다. (version 은 get() 에서 붙입니다)"""
+
+    def write_error(self, status_code, **kwargs):
+        # 상태 줄의 reason 은 ASCII 여야 하므로 한글 설명은 HTTPError 의 log_message 로 받아 본문에만 씁니다.
+        error = kwargs.get('exc_info', (None, None))[1]
+        if isinstance(error, tornado.web.HTTPError) and error.log_message:
+            message = error.log_message % error.args if error.args else error.log_message
+        else:
+            message = self._reason
+        self.finish(json.dumps({'error': message}, ensure_ascii=False))
+
+
+class FaqListHandler(JsonHandler):
+    """GET /api/faqs?q=&manufacturer=&limit=&cursor= — id 순 커서 페이지네이션."""
+    tables = queries.FAQ_TABLES
+
+    async def build_payload(self):
+        try:
+            after_id, limit = queries.parse_page_args(self.get_argument('cursor', None), self.get_argument('limit', None))
+        except ValueError as e:
+            raise tornado.web.HTTPError(400, '%s', str(e))
+
+        items, next_cursor = await self.run_query(
+            queries.fetch_faq_page, after_id, limit,
+            self.get_argument('q', None), self.get_argument('manufacturer', None))
+        return {'items': items, 'next_cursor': next_cursor}
+
+
+class FireRatesHandler(JsonHandler):
+    """GET /api/fire-rates — 연도/연료별 등록대수 10만 대당 화재 발생 횟수."""
+    tables = queries.FIRE_TABLES
+
+    async def build_payload(self):
+        return {'items': await self.run_query(queries.fetch_fire_rates)}
+
+
+class FireRateIntervalsHandler(JsonHandler):
+    """GET /api/fire-rates/intervals — 구분/항목별 발생률과 신뢰구간."""
+    tables = queries.FIRE_TABLES
+
+    async def build_payload(self):
+        return {'items': await self.run_query(queries.fetch_fire_rate_intervals)}
+
+
+def make_app():
+    return tornado.web.Application([
+        (r'/api/faqs', FaqListHandler),
+        (r'/api/fire-rates', FireRatesHandler),
+        (r'/api/fire-rates/intervals', FireRateIntervalsHandler),
+    ], compress_response=True)  # Accept-Encoding: gzip 요청에는 gzip으로 응답
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FAQ와 화재율을 JSON으로 제공하는 읽기 전용 API 서버")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+    args = parser.parse_args()
+
+    make_app().listen(args.port)
+    print(f"API 서버 시작: http://localhost:{args.port}/api/faqs")
+    tornado.ioloop.IOLoop.current().start()
+
+
+if __name__ == "__main__":
+    main()
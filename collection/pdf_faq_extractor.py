@@ -0,0 +1,207 @@
+import argparse
+import glob
+import json
+import os
+import re
+import unicodedata
+from concurrent.futures import ProcessPoolExecutor
+
+# --- 설정 ---
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+# 제조사 매뉴얼/FAQ PDF를 두는 디렉토리와 JSONL 출력 디렉토리
+PDF_DIRECTORY = os.path.join(SCRIPT_DIR, "..", "datasets", "manuals")
+OUT_DIRECTORY = os.path.join(SCRIPT_DIR, "..", "datasets", "faq")
+# 프로세스 하나가 한 번에 처리할 페이지 수
+PAGES_PER_TASK = 16
+
+# 질문/답변 분리 규칙 (CLI 옵션으로 덮어쓸 수 있음)
+DEFAULT_RULES = {
+    # 이 패턴에 맞는 줄은 질문으로 봅니다. (예: "Q. ...", "질문: ...", "...나요?")
+    'question_patterns': [
+        r'^(?:Q|질문)\s*[.:)\]]\s*\S',
+        r'^.{4,120}\?$',
+    ],
+    # 질문 앞의 "Q." 같은 표시는 제거합니다.
+    'question_prefix': r'^(?:Q|질문)\s*[.:)\]]\s*',
+    # 답변 앞의 "A." 같은 표시는 제거합니다.
+    'answer_prefix': r'^(?:A|답변)\s*[.:)\]]\s*',
+    # 매뉴얼의 소제목(짧고 마침표로 끝나지 않는 줄)도 질문으로 볼지 여부와 최대 길이.
+    # 좁은 단에서 줄바꿈된 답변 조각도 같은 모양이라 기본은 끔 (--headings 로 켬)
+    'headings_as_questions': False,
+    'heading_max_length': 30,
+    # 소제목은 본문 줄 폭(줄 길이 중앙값)의 이 비율보다 짧아야 합니다. 단을 채운 줄은 줄바꿈된 본문입니다.
+    'heading_width_ratio': 0.7,
+    # 이보다 짧은 답변은 버립니다.
+    'min_answer_length': 20,
+}
+
+# 복사/추출 과정에서 섞여 들어오는 특수문자: 제어문자, 사설 영역(아이콘 폰트) 글리프, 글머리표 등
+_STRAY_CHARS = re.compile(r'[\u0000-\u0008\u000b\u000c\u000e-\u001f\u00ad\u200b-\u200f\u2028-\u202e\u2060-\u206f\ue000-\uf8ff\ufeff\ufffd]')
+_BULLETS = re.compile(r'^[\s•·▪▫■□◆◇●○►▶※\-–—*]+')
+_PAGE_NUMBER = re.compile(r'^\s*(?:-?\s*\d{1,4}\s*-?|\d{1,4}\s*/\s*\d{1,4}|page\s*\d+)\s*$', re.IGNORECASE)
+# 이 문자로 끝나는 줄에서 문장이 끝난 것으로 봅니다. (그 밖의 줄 다음은 같은 문단의 이어지는 줄)
+_SENTENCE_END = ('.', '?', '!', '다', '요', ':', ')')
+
+
+# --- PDF 텍스트 추출 (페이지 병렬) ---
+def _extract_page_range(task):
+    """워커 프로세스: PDF를 열어 [start, end) 페이지의 텍스트를 추출합니다."""
+    from pypdf import PdfReader  # 워커에서만 필요
+
+    pdf_path, start, end = task
+    reader = PdfReader(pdf_path)
+    return [(page_no, reader.pages[page_no].extract_text() or '') for page_no in range(start, end)]
+
+
+def extract_pages(pdf_path, max_workers=None, pages_per_task=PAGES_PER_TASK):
+    """PDF의 페이지 텍스트를 프로세스 풀에서 병렬로 추출해 (페이지 번호, 텍스트)를 순서대로 반환합니다."""
+    from pypdf import PdfReader
+
+    page_count = len(PdfReader(pdf_path).pages)
+    tasks = [(pdf_path, start, min(start + pages_per_task, page_count))
+             for start in range(0, page_count, pages_per_task)]
+    if len(tasks) <= 1:
+        return [page for task in tasks for page in _extract_page_range(task)]
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return [page for chunk in executor.map(_extract_page_range, tasks) for page in chunk]
+
+
+# --- 정제 / 질문-답변 분리 ---
+def clean_line(line):
+    """특수문자와 글머리표를 제거하고 공백을 정규화합니다."""
+    line = unicodedata.normalize('NFC', line)
+    line = _STRAY_CHARS.sub('', line)
+    line = _BULLETS.sub('', line)
+    return re.sub(r'\s+', ' ', line).strip()
+
+
+def clean_lines(pages):
+    """(페이지 번호, 텍스트)들을 정제된 (페이지 번호, 줄)로 풉니다. 쪽 번호와 빈 줄은 버립니다."""
+    for page_no, text in pages:
+        for raw in text.splitlines():
+            if _PAGE_NUMBER.match(raw):
+                continue
+            line = clean_line(raw)
+            if line:
+                yield page_no, line
+
+
+def _join(parts):
+    text = ''
+    for part in parts:
+        if text.endswith('-') and part[:1].isascii() and part[:1].isalpha():
+            text = text[:-1] + part  # 영문 하이픈 줄바꿈 복원
+        elif text:
+            text += ' ' + part
+        else:
+            text = part
+    return text
+
+
+def _heading_limit(lines, rules):
+    """소제목으로 볼 최대 길이: heading_max_length 와 본문 줄 폭 * heading_width_ratio 중 작은 값."""
+    widths = sorted(len(line) for _, line in lines)
+    if not widths:
+        return rules['heading_max_length']
+    return min(rules['heading_max_length'], int(widths[len(widths) // 2] * rules['heading_width_ratio']))
+
+
+def _is_question(line, rules, compiled_patterns, heading_limit, continuation=False):
+    """continuation 이면 앞 줄의 문장이 끝나지 않은 것이므로 소제목 규칙을 적용하지 않습니다."""
+    if any(p.search(line) for p in compiled_patterns):
+        return True
+    if rules['headings_as_questions'] and not continuation:
+        return len(line) <= heading_limit and not line.endswith(('.', ',', ':', ';', ')', '다'))
+    return False
+
+
+def segment_faqs(lines, rules=None):
+    """정제된 (페이지 번호, 줄) 스트림을 질문/답변 쌍으로 나눠 dict를 하나씩 내보냅니다."""
+    rules = {**DEFAULT_RULES, **(rules or {})}
+    compiled_patterns = [re.compile(p) for p in rules['question_patterns']]
+    question_prefix = re.compile(rules['question_prefix'])
+    answer_prefix = re.compile(rules['answer_prefix'])
+    lines = list(lines)
+    heading_limit = _heading_limit(lines, rules)
+
+    question, page, answer_parts = None, None, []
+
+    def flush():
+        answer = _join(answer_parts)
+        if question and len(answer) >= rules['min_answer_length']:
+            return {'question': question, 'answer': answer, 'page': page + 1}
+        return None
+
+    for page_no, line in lines:
+        # 답변 문장이 줄바꿈으로 끊긴 경우, 다음 줄은 짧아도 소제목이 아니라 같은 문단입니다.
+        continuation = bool(answer_parts) and not answer_parts[-1].endswith(_SENTENCE_END)
+        if _is_question(line, rules, compiled_patterns, heading_limit, continuation):
+            faq = flush()
+            if faq:
+                yield faq
+            # 연속된 소제목은 하나의 질문으로 합칩니다 (예: 장 제목 + 절 제목 → 절 제목)
+            question, page, answer_parts = question_prefix.sub('', line), page_no, []
+        elif question:
+            answer_parts.append(answer_prefix.sub('', line) if not answer_parts else line)
+
+    faq = flush()
+    if faq:
+        yield faq
+
+
+def extract_pdf_to_jsonl(pdf_path, out_path=None, rules=None, max_workers=None, pages_per_task=PAGES_PER_TASK):
+    """PDF 하나를 JSONL(FAQ 한 줄에 하나)로 변환하고 저장한 FAQ 개수를 반환합니다."""
+    if out_path is None:
+        out_path = os.path.join(OUT_DIRECTORY, os.path.splitext(os.path.basename(pdf_path))[0] + '.jsonl')
+    os.makedirs(os.path.dirname(out_path), exist_ok=True)
+
+    pages = extract_pages(pdf_path, max_workers=max_workers, pages_per_task=pages_per_task)
+    count = 0
+    tmp_path = out_path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        for faq in segment_faqs(clean_lines(pages), rules):
+            faq['source'] = os.path.basename(pdf_path)
+            f.write(json.dumps(faq, ensure_ascii=False) + '\n')
+            count += 1
+    os.replace(tmp_path, out_path)
+    print(f"[OK] {len(pages)}페이지 → FAQ {count}개 저장 → {out_path}")
+    return count
+
+
+def extract_directory(pdf_paths=None, rules=None, max_workers=None):
+    """PDF들(기본: PDF_DIRECTORY 의 *.pdf)을 각각 JSONL로 변환하고 총 FAQ 개수를 반환합니다."""
+    pdf_paths = pdf_paths or sorted(glob.glob(os.path.join(PDF_DIRECTORY, '*.pdf')))
+    if not pdf_paths:
+        print(f"경로에 PDF 파일이 없습니다: {PDF_DIRECTORY}")
+        return 0
+    return sum(extract_pdf_to_jsonl(pdf_path, rules=rules, max_workers=max_workers) for pdf_path in pdf_paths)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="매뉴얼/FAQ PDF에서 질문/답변을 추출해 JSONL로 저장합니다.")
+    parser.add_argument('pdfs', nargs='*', help=f"PDF 파일 (기본: {PDF_DIRECTORY}/*.pdf)")
+    parser.add_argument('--workers', type=int, default=None, help="페이지 추출 프로세스 수")
+    parser.add_argument('--question-pattern', action='append', default=None,
+                        help="질문으로 볼 줄의 정규식 (여러 번 지정 가능)")
+    parser.add_argument('--headings', action='store_true', help="짧은 소제목도 질문으로 봄")
+    parser.add_argument('--heading-max-length', type=int, default=DEFAULT_RULES['heading_max_length'])
+    parser.add_argument('--heading-width-ratio', type=float, default=DEFAULT_RULES['heading_width_ratio'])
+    parser.add_argument('--min-answer-length', type=int, default=DEFAULT_RULES['min_answer_length'])
+    args = parser.parse_args(argv)
+
+    rules = {
+        'headings_as_questions': args.headings,
+        'heading_max_length': args.heading_max_length,
+        'heading_width_ratio': args.heading_width_ratio,
+        'min_answer_length': args.min_answer_length,
+    }
+    if args.question_pattern:
+        rules['question_patterns'] = args.question_pattern
+
+    extract_directory(args.pdfs, rules=rules, max_workers=args.workers)
+
+
+# --- 스크립트 실행 ---
+if __name__ == "__main__":
+    main()
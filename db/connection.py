@@ -1,14 +1,25 @@
-import mysql.connector
+import threading
+
+# --- 설정 ---
+DB_CONFIG = {
+    'host': "localhost",
+    'database': "ev_fire",
+    'user': "ohgiraffers",
+    'password': "ohgiraffers",
+}
+# API 서버 등 여러 요청이 연결을 재사용할 때의 풀 크기
+POOL_SIZE = 8
+
+_pool = None
+_pool_lock = threading.Lock()
+
 
 def get_connection():
     """MySQL 데이터베이스 연결 객체를 반환합니다."""
+    import mysql.connector  # 첫 연결 시점에 임포트 (페이지 콜드 스타트 단축)
+
     try:
-        conn = mysql.connector.connect(
-            host="localhost",
-            database="ev_fire",
-            user="ohgiraffers",
-            password="ohgiraffers"
-        )
+        conn = mysql.connector.connect(**DB_CONFIG)
         if conn.is_connected():
             print("MySQL에 성공적으로 연결되었습니다! (ohgiraffers 계정)")
             return conn
@@ -16,10 +27,31 @@ def get_connection():
         print(f"MySQL 연결 오류: {e}")
         return None
 
+def get_pooled_connection():
+    """
+    연결 풀에서 연결을 꺼내 반환합니다. close() 하면 실제로 끊지 않고 풀로 돌려줍니다.
+    풀은 첫 호출 때 만들어지며, 풀이 비어 있으면 mysql.connector.errors.PoolError 가 발생합니다.
+    """
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from mysql.connector import pooling
+
+                _pool = pooling.MySQLConnectionPool(pool_name="ev_fire", pool_size=POOL_SIZE, **DB_CONFIG)
+    return _pool.get_connection()
+
+def __getattr__(name):
+    """`db.connection.Error` 로 mysql.connector.Error 를 사용할 때 처음 임포트합니다."""
+    if name == 'Error':
+        import mysql.connector
+        return mysql.connector.Error
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 if __name__ == "__main__":
     # 이 파일이 직접 실행될 때만 연결 테스트
     conn = get_connection()
     if conn:
         print("Connection test successful.")
         conn.close()
-        print("Connection closed.")
\ No newline at end of file
+        print("Connection closed.")
@@ -0,0 +1,260 @@
+import argparse
+import glob
+import hashlib
+import importlib
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+
+from db.connection import get_connection
+
+DB_DIR = os.path.abspath(os.path.dirname(__file__))
+ROOT_DIR = os.path.abspath(os.path.join(DB_DIR, '..'))
+
+# --- 설정 ---
+DATASET_PATH = os.path.join(ROOT_DIR, 'datasets')
+# 스테이지별 체크포인트(입력 파일 해시)를 저장하는 파일
+CHECKPOINT_PATH = os.path.join(DB_DIR, '.ingest_checkpoints.json')
+
+
+class Stage:
+    """
+    ingest DAG의 한 단계. inputs 는 체크포인트 해시 대상 파일(glob 패턴 허용)입니다.
+    always_run 스테이지(예: 원격 사이트를 읽는 스크래퍼)는 입력이 그대로여도 선택되면 항상 실행합니다.
+    """
+
+    def __init__(self, name, run, inputs=(), deps=(), optional=False, always_run=False):
+        self.name = name
+        self.run = run
+        self.inputs = list(inputs)
+        self.deps = list(deps)
+        self.optional = optional
+        self.always_run = always_run
+
+
+# --- 스테이지 실행 함수 ---
+def _run_script(module_name, func_name):
+    """db.sql, collection 모듈의 함수를 그대로 호출합니다 (스크래퍼의 selenium 등은 필요할 때만 임포트)."""
+    def run():
+        getattr(importlib.import_module(module_name), func_name)()
+    return run
+
+
+def _run_csv_loader(func_name):
+    """load_csv_data.py 의 cursor 기반 로더를 스테이지 전용 연결로 실행합니다."""
+    def run():
+        loader = getattr(importlib.import_module('db.sql.load_csv_data'), func_name)
+        conn = get_connection()
+        if not conn:
+            raise RuntimeError("DB 연결에 실패했습니다.")
+        try:
+            cursor = conn.cursor()
+            loader(cursor)
+            conn.commit()
+            cursor.close()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+    return run
+
+
+def _sql(name):
+    return os.path.join(DB_DIR, 'sql', name)
+
+
+def _dataset(name):
+    return os.path.join(DATASET_PATH, name)
+
+
+STAGES = [
+    Stage('chevrolet_scraper', _run_script('collection.chevrolet_faq_scraper', 'main'),
+          inputs=[os.path.join(ROOT_DIR, 'collection', 'chevrolet_faq_scraper.py')],
+          optional=True, always_run=True),
+    Stage('kia_scraper', _run_script('collection.kia_ev_faq_scraper', 'main'),
+          inputs=[os.path.join(ROOT_DIR, 'collection', 'kia_ev_faq_scraper.py')],
+          optional=True, always_run=True),
+    Stage('pdf_faq', _run_script('collection.pdf_faq_extractor', 'extract_directory'),
+          inputs=[os.path.join(ROOT_DIR, 'collection', 'pdf_faq_extractor.py'),
+                  os.path.join(DATASET_PATH, 'manuals', '*.pdf')]),
+    Stage('create_tables', _run_script('db.sql.create_tables', 'create_tables'),
+          inputs=[_sql('create_tables.py')]),
+    Stage('model_catalog', _run_csv_loader('load_model_catalog'),
+          inputs=[_sql('load_csv_data.py'), _sql('model_matcher.py'),
+                  _dataset('한국전력공사_전기차량 제조사별 모델 정보_20250630.csv')],
+          deps=['create_tables']),
+    Stage('total_fire_incidents', _run_csv_loader('load_total_fire_incidents'),
+          inputs=[_sql('load_csv_data.py'), _sql('typed_csv.py'), _dataset('소방청_차량화재통계.csv')],
+          deps=['create_tables']),
+    Stage('vehicle_registrations', _run_csv_loader('load_vehicle_registrations'),
+          inputs=[_sql('load_csv_data.py'), _dataset('Vehicles_*.csv')],
+          deps=['create_tables']),
+    Stage('ev_fire_cases', _run_csv_loader('load_ev_fire_cases'),
+          inputs=[_sql('load_csv_data.py'), _sql('typed_csv.py'), _dataset('전기차 화재 발생 현황.csv')],
+          deps=['create_tables']),
+    Stage('faq', _run_script('db.sql.faq', 'load_and_insert_faqs'),
+          inputs=[_sql('faq.py'), _sql('faq_dedup.py'), _sql('faq_history.py'), _sql('faq_topics.py'),
+                  _sql('model_matcher.py'), _dataset('model_alias_rules.csv'),
+                  os.path.join(DATASET_PATH, 'faq', '*.json'), os.path.join(DATASET_PATH, 'faq', '*.jsonl')],
+          deps=['create_tables', 'model_catalog', 'chevrolet_scraper', 'kia_scraper', 'pdf_faq']),
+]
+
+
+# --- 체크포인트 ---
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def input_hashes(stage):
+    """스테이지 입력 파일들의 {경로: sha256} 를 반환합니다. 없는 파일은 None 으로 기록합니다."""
+    hashes = {}
+    for pattern in stage.inputs:
+        paths = sorted(glob.glob(pattern)) if glob.has_magic(pattern) else [pattern]
+        for path in paths:
+            key = os.path.relpath(path, ROOT_DIR)
+            hashes[key] = file_sha256(path) if os.path.exists(path) else None
+    return hashes
+
+
+def stage_fingerprint(stage, hashes, upstream_fingerprints):
+    """입력 해시와 선행 스테이지 지문을 합친 지문. 선행 스테이지가 다시 실행되면 후행도 다시 실행됩니다."""
+    payload = json.dumps({'inputs': hashes, 'deps': upstream_fingerprints}, sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def load_checkpoints(path=CHECKPOINT_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_checkpoints(checkpoints, path=CHECKPOINT_PATH):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(checkpoints, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+# --- DAG 실행 ---
+def select_stages(stages, include_optional=False, only=None):
+    """실행할 스테이지를 고르고, 선택되지 않은 선행 스테이지 의존성은 제거합니다."""
+    selected = [s for s in stages if include_optional or not s.optional]
+    if only:
+        by_name = {s.name: s for s in selected}
+        wanted, stack = set(), list(only)
+        while stack:
+            name = stack.pop()
+            if name not in by_name:
+                raise ValueError(f"알 수 없는 스테이지: {name}")
+            if name not in wanted:
+                wanted.add(name)
+                stack.extend(by_name[name].deps)
+        selected = [s for s in selected if s.name in wanted]
+
+    names = {s.name for s in selected}
+    return [Stage(s.name, s.run, s.inputs, [d for d in s.deps if d in names], s.optional, s.always_run)
+            for s in selected]
+
+
+def run_pipeline(stages, max_workers=4, force=False, checkpoint_path=CHECKPOINT_PATH):
+    """
+    의존성이 해결된 스테이지부터 병렬로 실행합니다.
+    입력과 선행 스테이지가 바뀌지 않은 스테이지는 건너뛰고, 실패한 스테이지의 후행 스테이지는 실행하지 않습니다.
+    반환값은 {스테이지명: 'done' | 'skipped' | 'failed' | 'blocked'} 입니다.
+    """
+    by_name = {s.name: s for s in stages}
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"'{stage.name}' 의 선행 스테이지 '{dep}' 가 없습니다.")
+
+    checkpoints = load_checkpoints(checkpoint_path)
+    status = {}
+    fingerprints = {}
+    pending = {s.name for s in stages}
+    running = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            # 선행 스테이지가 실패한 스테이지는 차단
+            for name in sorted(pending):
+                if any(status.get(dep) in ('failed', 'blocked') for dep in by_name[name].deps):
+                    status[name] = 'blocked'
+                    pending.discard(name)
+                    print(f"[ingest] {name}: 선행 스테이지 실패로 건너뜀")
+
+            ready = [n for n in sorted(pending)
+                     if all(status.get(dep) in ('done', 'skipped') for dep in by_name[n].deps)]
+            for name in ready:
+                pending.discard(name)
+                stage = by_name[name]
+                hashes = input_hashes(stage)
+                fingerprint = stage_fingerprint(stage, hashes, {d: fingerprints[d] for d in stage.deps})
+                fingerprints[name] = fingerprint
+
+                # always_run 스테이지의 결과물(예: 스크랩한 JSON)은 후행 스테이지가 입력 해시로 다시 확인합니다.
+                if not force and not stage.always_run and checkpoints.get(name, {}).get('fingerprint') == fingerprint:
+                    status[name] = 'skipped'
+                    print(f"[ingest] {name}: 변경 없음, 건너뜀")
+                    continue
+
+                print(f"[ingest] {name}: 시작")
+                running[executor.submit(stage.run)] = (name, hashes, fingerprint)
+
+            if not running:
+                if pending and not ready:
+                    raise ValueError(f"순환 의존성이 있습니다: {sorted(pending)}")
+                continue
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name, hashes, fingerprint = running.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    status[name] = 'failed'
+                    checkpoints.pop(name, None)
+                    print(f"[ingest] {name}: 실패 ({e})")
+                else:
+                    status[name] = 'done'
+                    checkpoints[name] = {
+                        'fingerprint': fingerprint,
+                        'inputs': hashes,
+                        'completed_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    }
+                    print(f"[ingest] {name}: 완료")
+                # 스테이지가 끝날 때마다 저장해서, 중간에 중단돼도 다음 실행에서 이어서 진행합니다.
+                save_checkpoints(checkpoints, checkpoint_path)
+
+    return status
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB 테이블 생성부터 CSV/FAQ 적재까지 한 번에 실행합니다.")
+    parser.add_argument('--scrape', action='store_true', help="FAQ 스크래퍼(selenium)도 함께 실행")
+    parser.add_argument('--force', action='store_true', help="체크포인트를 무시하고 모든 스테이지 재실행")
+    parser.add_argument('--only', nargs='+', metavar='STAGE', help="지정한 스테이지와 그 선행 스테이지만 실행")
+    parser.add_argument('--workers', type=int, default=4, help="동시에 실행할 스테이지 수")
+    args = parser.parse_args()
+
+    stages = select_stages(STAGES, include_optional=args.scrape, only=args.only)
+    status = run_pipeline(stages, max_workers=args.workers, force=args.force)
+
+    print("\n--- ingest 결과 ---")
+    for stage in stages:
+        print(f"{stage.name}: {status.get(stage.name)}")
+    if any(s in ('failed', 'blocked') for s in status.values()):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
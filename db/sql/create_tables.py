@@ -1,80 +1,161 @@
 import mysql.connector
 
-# mysql 서버 접속 가능한 연결 객체 생성 (root 계정)
-connection = mysql.connector.connect(
-    host="localhost",
-    user="root",
-    password="121512"
-)
-
-# Test Connection 메서드
-if connection.is_connected():
+# SQL DDL statements
+SQL_DDL = """
+CREATE DATABASE IF NOT EXISTS ev_fire;
+
+USE ev_fire;
+
+CREATE TABLE IF NOT EXISTS EV_Manufacturer (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    name VARCHAR(100) UNIQUE NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS EV_Model (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    manufacturer_id INT NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    UNIQUE KEY uq_model (manufacturer_id, name),
+    FOREIGN KEY (manufacturer_id) REFERENCES EV_Manufacturer(id)
+);
+
+DROP TABLE IF EXISTS vehicle_registrations;
+
+CREATE TABLE IF NOT EXISTS vehicle_registrations (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    year INT NOT NULL,
+    month TINYINT NOT NULL DEFAULT 0, -- 0: 연간 집계, 1~12: 월별
+    fuel_type VARCHAR(50) NOT NULL,
+    region VARCHAR(50) NOT NULL DEFAULT '전국',
+    count INT NOT NULL,
+    source_url VARCHAR(255),
+    UNIQUE KEY uq_registration_period (year, month, fuel_type, region)
+);
+
+DROP TABLE IF EXISTS total_fire_incidents;
+CREATE TABLE IF NOT EXISTS total_fire_incidents (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    year INT NOT NULL,
+    total_fires INT NOT NULL,
+    general_road INT,
+    highway INT,
+    other_road INT,
+    parking_lot INT,
+    vacant_lot INT,
+    tunnel INT,
+    UNIQUE KEY uq_fire_year (year)
+);
+
+DROP TABLE IF EXISTS ev_fire_cases;
+CREATE TABLE IF NOT EXISTS ev_fire_cases (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    year INT NOT NULL,
+    total_fires INT NOT NULL,
+    total_casualties INT,
+    deaths INT,
+    injuries INT,
+    property_damage_krw BIGINT,
+    UNIQUE KEY uq_ev_fire_year (year)
+);
+
+-- FAQ 현재 버전 (재적재 시 내용이 바뀐 항목만 갱신되므로 DROP 하지 않습니다)
+CREATE TABLE IF NOT EXISTS EV_Manufacturer_FAQ (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    manufacturer_id INT NOT NULL,
+    faq_key CHAR(40) NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    content_hash CHAR(64) NOT NULL,
+    version INT NOT NULL DEFAULT 1,
+    captured_at DATETIME NOT NULL,
+    cluster_id INT,
+    UNIQUE KEY uq_faq_key (faq_key),
+    INDEX idx_faq_cluster (cluster_id),
+    FOREIGN KEY (manufacturer_id) REFERENCES EV_Manufacturer(id)
+);
+
+-- FAQ 버전 이력 (append-only). 스냅샷 버전은 answer, 나머지는 직전 버전 대비 delta 만 저장
+CREATE TABLE IF NOT EXISTS EV_FAQ_Version (
+    faq_key CHAR(40) NOT NULL,
+    version INT NOT NULL,
+    manufacturer_id INT NOT NULL,
+    change_type ENUM('added', 'modified', 'removed') NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT,
+    delta MEDIUMTEXT,
+    content_hash CHAR(64) NOT NULL,
+    captured_at DATETIME NOT NULL,
+    PRIMARY KEY (faq_key, version),
+    INDEX idx_faq_version_captured (captured_at),
+    FOREIGN KEY (manufacturer_id) REFERENCES EV_Manufacturer(id)
+);
+
+DROP TABLE IF EXISTS EV_FAQ_Model_Mention;
+CREATE TABLE IF NOT EXISTS EV_FAQ_Model_Mention (
+    faq_id INT NOT NULL,
+    model_id INT NOT NULL,
+    PRIMARY KEY (faq_id, model_id),
+    INDEX idx_mention_model (model_id),
+    FOREIGN KEY (model_id) REFERENCES EV_Model(id)
+);
+
+DROP TABLE IF EXISTS EV_FAQ_Topic;
+CREATE TABLE IF NOT EXISTS EV_FAQ_Topic (
+    faq_id INT NOT NULL,
+    topic VARCHAR(20) NOT NULL,
+    PRIMARY KEY (faq_id, topic),
+    INDEX idx_topic (topic)
+);
+
+-- Create user and grant privileges
+CREATE USER IF NOT EXISTS 'ohgiraffers'@'localhost' IDENTIFIED BY 'ohgiraffers';
+GRANT ALL PRIVILEGES ON ev_fire.* TO 'ohgiraffers'@'localhost';
+FLUSH PRIVILEGES;
+
+"""
+
+# EV_Manufacturer_FAQ 가 버전 이력 도입 전 스키마면 이 컬럼들이 없습니다.
+FAQ_REQUIRED_COLUMNS = {'faq_key', 'content_hash', 'version', 'cluster_id'}
+
+
+def migrate_legacy_faq_table(cursor):
+    """
+    이전 스키마의 EV_Manufacturer_FAQ 가 남아 있으면 삭제합니다. (1회성 마이그레이션)
+    예전에는 적재할 때마다 테이블을 비우고 다시 채웠으므로, 새 스키마로 다시 만든 뒤
+    FAQ 적재 단계가 JSON 파일에서 다시 채웁니다. 삭제했으면 True 를 반환합니다.
+    """
+    cursor.execute("""
+        SELECT column_name FROM information_schema.columns
+        WHERE table_schema = 'ev_fire' AND table_name = 'EV_Manufacturer_FAQ'
+    """)
+    columns = {(row[0].decode() if isinstance(row[0], (bytes, bytearray)) else row[0]).lower()
+               for row in cursor.fetchall()}
+    if not columns or FAQ_REQUIRED_COLUMNS <= columns:
+        return False
+    print(f"이전 스키마의 EV_Manufacturer_FAQ 발견 (없는 컬럼: {sorted(FAQ_REQUIRED_COLUMNS - columns)}) → 다시 생성합니다.")
+    cursor.execute("DROP TABLE ev_fire.EV_Manufacturer_FAQ")
+    return True
+
+
+def create_tables():
+    # mysql 서버 접속 가능한 연결 객체 생성 (root 계정)
+    connection = mysql.connector.connect(
+        host="localhost",
+        user="root",
+        password="121512"
+    )
+
+    # Test Connection 메서드
+    if not connection.is_connected():
+        print("MySQL 연결에 실패했습니다!")
+        raise RuntimeError("MySQL 연결에 실패했습니다!")
+
     print("MySQL에 성공적으로 연결되었습니다! (root 계정)")
 
     cursor = connection.cursor()
 
-    # SQL DDL statements
-    SQL_DDL = """
-    CREATE DATABASE IF NOT EXISTS ev_fire;
-
-    USE ev_fire;
-
-    DROP TABLE IF EXISTS EV_Manufacturer_FAQ;
-
-    CREATE TABLE IF NOT EXISTS EV_Manufacturer (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        name VARCHAR(100) UNIQUE NOT NULL
-    );
-
-    DROP TABLE IF EXISTS vehicle_registrations;
-
-    CREATE TABLE IF NOT EXISTS vehicle_registrations (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        year INT NOT NULL,
-        fuel_type VARCHAR(50) NOT NULL,
-        count INT NOT NULL,
-        source_url VARCHAR(255)
-    );
-
-    DROP TABLE IF EXISTS total_fire_incidents;
-    CREATE TABLE IF NOT EXISTS total_fire_incidents (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        year INT NOT NULL,
-        total_fires INT NOT NULL,
-        general_road INT,
-        highway INT,
-        other_road INT,
-        parking_lot INT,
-        vacant_lot INT,
-        tunnel INT
-    );
-
-    DROP TABLE IF EXISTS ev_fire_cases;
-    CREATE TABLE IF NOT EXISTS ev_fire_cases (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        year INT NOT NULL,
-        total_fires INT NOT NULL,
-        total_casualties INT,
-        deaths INT,
-        injuries INT,
-        property_damage_krw BIGINT
-    );
-
-    CREATE TABLE IF NOT EXISTS EV_Manufacturer_FAQ (
-        id INT AUTO_INCREMENT PRIMARY KEY,
-        manufacturer_id INT NOT NULL,
-        question TEXT NOT NULL,
-        answer TEXT NOT NULL,
-        captured_at DATETIME NOT NULL,
-        FOREIGN KEY (manufacturer_id) REFERENCES EV_Manufacturer(id)
-    );
-
-    -- Create user and grant privileges
-    CREATE USER IF NOT EXISTS 'ohgiraffers'@'localhost' IDENTIFIED BY 'ohgiraffers';
-    GRANT ALL PRIVILEGES ON ev_fire.* TO 'ohgiraffers'@'localhost';
-    FLUSH PRIVILEGES;
-
-    """
+    # 버전 이력 도입 전 FAQ 테이블은 CREATE TABLE IF NOT EXISTS 로 바뀌지 않으므로 먼저 정리
+    migrate_legacy_faq_table(cursor)
 
     # Execute each statement
     for statement in SQL_DDL.split(';'):
@@ -87,7 +168,8 @@ if connection.is_connected():
     cursor.close()
     connection.close()
 
-    if connection.is_closed():
+    if not connection.is_connected():
         print("MySQL 연결이 닫혔습니다!")
-else:
-    print("MySQL 연결에 실패했습니다!")
\ No newline at end of file
+
+if __name__ == "__main__":
+    create_tables()
@@ -2,19 +2,49 @@ import json
 import os
 from datetime import datetime
 import glob
-import sys # Add sys import
-
-# Add the parent directory to the Python path to enable importing connection.py
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # connection.py에서 get_connection 함수 임포트
-from connection import get_connection
+from db.connection import get_connection
+from db.sql.faq_dedup import assign_faq_clusters
+from db.sql.faq_history import sync_faqs
+from db.sql.faq_topics import tag_faq_topics
+from db.sql.model_matcher import (
+    build_manufacturer_matcher, fetch_model_matcher, normalize, read_model_catalog, tag_texts
+)
 
 # --- 설정 ---
 # FAQ JSON 파일들이 있는 디렉토리 경로
 FAQ_JSON_DIRECTORY = os.path.join(os.path.dirname(__file__), '..', '..', 'datasets', 'faq')
 # C:\Users\minek\github\SKN19-1st-04Team\datasets\faq
 
+# --- FAQ 파일 읽기 ---
+def read_faq_file(file_path):
+    """스크래퍼의 JSON 배열 파일 또는 PDF 추출기의 JSONL 파일을 FAQ dict 목록으로 읽습니다."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        if file_path.endswith('.jsonl'):
+            return [json.loads(line) for line in f if line.strip()]
+        return json.load(f)
+
+# --- 차량 모델 태깅 ---
+def tag_faq_models(cursor):
+    model_matcher = fetch_model_matcher(cursor)
+    cursor.execute("SELECT id, question, answer FROM EV_Manufacturer_FAQ")
+    rows = cursor.fetchall()
+    mentions = tag_texts(model_matcher, [f"{question} {answer}" for _, question, answer in rows])
+
+    # 기존 태그와 비교해 달라진 부분만 반영 (FAQ가 그대로면 쓰기 없음)
+    cursor.execute("SELECT faq_id, model_id FROM EV_FAQ_Model_Mention")
+    existing = set(cursor.fetchall())
+    desired = {(faq_id, model_id) for (faq_id, _, _), model_ids in zip(rows, mentions) for model_id in model_ids}
+
+    stale = sorted(existing - desired)
+    new = sorted(desired - existing)
+    if stale:
+        cursor.executemany("DELETE FROM EV_FAQ_Model_Mention WHERE faq_id = %s AND model_id = %s", stale)
+    if new:
+        cursor.executemany("INSERT INTO EV_FAQ_Model_Mention (faq_id, model_id) VALUES (%s, %s)", new)
+    print(f"FAQ {len(rows)}개에서 모델 언급 {len(desired)}건 태깅 완료 (추가 {len(new)}, 삭제 {len(stale)}).")
+
 # --- 메인 데이터 로드 및 삽입 로직 ---
 def load_and_insert_faqs():
     conn = None
@@ -22,104 +52,112 @@ def load_and_insert_faqs():
     try:
         conn = get_connection() # connection.py의 get_connection 사용
         if not conn:
-            return
+            raise RuntimeError("DB 연결에 실패했습니다.")
 
         cursor = conn.cursor()
 
-        # 1. 기존 데이터 전부 삭제 (TRUNCATE)
-        print("기존 FAQ 데이터 삭제 중...")
-        cursor.execute("TRUNCATE TABLE EV_Manufacturer_FAQ")
-        print("기존 데이터 삭제 완료.")
+        # 1. FAQ 파일을 읽어 제조사별로 모으기
+        # 파일명에 포함된 제조사명/영문 별칭을 모델 카탈로그의 제조사명으로 매칭합니다.
+        manufacturer_matcher = build_manufacturer_matcher({m for m, _ in read_model_catalog()})
 
-        # 2. EV_Manufacturer 테이블에서 제조사 ID 가져오기 또는 새로 생성
-        # 이 부분은 기존 faq.py의 get_or_create_manufacturer_id 로직을 단순화합니다.
-        # 실제 프로젝트에서는 EV_Manufacturer 테이블이 미리 채워져 있거나,
-        # 스크래퍼에서 제조사 정보를 명확히 제공해야 합니다.
-        # 여기서는 파일명에서 제조사를 유추합니다.
-        
         # 제조사 ID를 저장할 딕셔너리
         manufacturer_ids = {}
         
-        # 모든 JSON 파일 찾기
-        json_files = glob.glob(os.path.join(FAQ_JSON_DIRECTORY, '*.json'))
+        # 모든 JSON / JSONL(PDF 추출 결과) 파일 찾기
+        json_files = sorted(glob.glob(os.path.join(FAQ_JSON_DIRECTORY, '*.json')) +
+                            glob.glob(os.path.join(FAQ_JSON_DIRECTORY, '*.jsonl')))
         if not json_files:
             print(f"경로에 JSON 파일이 없습니다: {FAQ_JSON_DIRECTORY}")
             return
 
-        total_inserted_count = 0
+        total_counts = {'added': 0, 'modified': 0, 'removed': 0, 'unchanged': 0}
         captured_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
+        # 같은 제조사의 파일(예: 웹 FAQ + 매뉴얼 PDF)은 모아서 한 번에 비교합니다.
+        faqs_by_manufacturer = {}
+        failed_manufacturers = set()
+
         for file_path in json_files:
             print(f"\n파일 처리 중: {file_path}")
             
             # 파일명에서 제조사 이름 유추
-            filename = os.path.basename(file_path).lower()
-            manufacturer_name = "Unknown"
-            if "chevrolet" in filename:
-                manufacturer_name = "Chevrolet"
-            elif "kia" in filename:
-                manufacturer_name = "Kia"
-            elif "renault" in filename: # 르노도 추가
-                manufacturer_name = "Renault"
-            elif "tesla" in filename: # 테슬라 추가
-                manufacturer_name = "Tesla"
-            # 필요에 따라 다른 제조사 추가
-
-            # 제조사 ID 가져오기 또는 생성
-            if manufacturer_name not in manufacturer_ids:
-                cursor.execute("SELECT id FROM EV_Manufacturer WHERE name = %s", (manufacturer_name,))
-                result = cursor.fetchone()
-                if result:
-                    manufacturer_ids[manufacturer_name] = result[0]
-                else:
-                    print(f"제조사 '{manufacturer_name}'를 EV_Manufacturer 테이블에 추가합니다.")
-                    cursor.execute("INSERT INTO EV_Manufacturer (name) VALUES (%s)", (manufacturer_name,))
-                    manufacturer_ids[manufacturer_name] = cursor.lastrowid
-            
-            current_manufacturer_id = manufacturer_ids[manufacturer_name]
+            filename = os.path.splitext(os.path.basename(file_path))[0]
+            matched = manufacturer_matcher.find_all(normalize(filename))
+            manufacturer_name = min(matched) if matched else "Unknown"
 
             # JSON 파일 로드
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    faqs = json.load(f)
+                faqs = read_faq_file(file_path)
             except (FileNotFoundError, json.JSONDecodeError) as e:
                 print(f"JSON 파일 로드 오류 ({file_path}): {e}")
+                # 일부 파일만 읽고 비교하면 나머지가 삭제로 기록되므로 해당 제조사는 이번에 건너뜁니다.
+                failed_manufacturers.add(manufacturer_name)
                 continue
 
             if not faqs:
                 print(f"파일에 FAQ 데이터가 없습니다: {file_path}")
                 continue
 
-            # 3. FAQ 데이터 삽입
-            insert_sql = """
-            INSERT INTO EV_Manufacturer_FAQ (manufacturer_id, question, answer, captured_at)
-            VALUES (%s, %s, %s, %s)
-            """
-            
-            inserted_count_for_file = 0
+            valid_faqs = faqs_by_manufacturer.setdefault(manufacturer_name, [])
             for faq in faqs:
                 question = faq.get('question')
                 answer = faq.get('answer')
 
-                if question and answer: # 질문과 답변이 모두 있는 경우만 삽입
-                    try:
-                        cursor.execute(insert_sql, (current_manufacturer_id, question, answer, captured_at))
-                        inserted_count_for_file += 1
-                    except mysql.connector.Error as err:
-                        print(f"데이터 삽입 오류 (질문: {question[:30]}...): {err}")
+                if question and answer: # 질문과 답변이 모두 있는 경우만 반영
+                    valid_faqs.append((question, answer))
                 else:
                     print(f"유효하지 않은 FAQ 항목 건너뛰기 (질문 또는 답변 없음): {faq}")
 
-            conn.commit() # 파일별로 커밋
-            total_inserted_count += inserted_count_for_file
-            print(f"'{manufacturer_name}' 제조사 FAQ {inserted_count_for_file}개 삽입 완료.")
+        # 2. 기존 FAQ와 비교해 추가/변경/삭제된 항목만 반영 (버전 이력 기록)
+        for manufacturer_name, valid_faqs in faqs_by_manufacturer.items():
+            if manufacturer_name in failed_manufacturers:
+                print(f"'{manufacturer_name}' 제조사는 파일 오류로 이번 적재에서 제외합니다.")
+                continue
+
+            # 제조사 ID 가져오기 또는 생성
+            if manufacturer_name not in manufacturer_ids:
+                cursor.execute("SELECT id FROM EV_Manufacturer WHERE name = %s", (manufacturer_name,))
+                result = cursor.fetchone()
+                if result:
+                    manufacturer_ids[manufacturer_name] = result[0]
+                else:
+                    print(f"제조사 '{manufacturer_name}'를 EV_Manufacturer 테이블에 추가합니다.")
+                    cursor.execute("INSERT INTO EV_Manufacturer (name) VALUES (%s)", (manufacturer_name,))
+                    manufacturer_ids[manufacturer_name] = cursor.lastrowid
+            
+            current_manufacturer_id = manufacturer_ids[manufacturer_name]
+
+            counts = sync_faqs(cursor, current_manufacturer_id, manufacturer_name, valid_faqs, captured_at)
+            conn.commit() # 제조사별로 커밋
+            for change_type, count in counts.items():
+                total_counts[change_type] += count
+            print(f"'{manufacturer_name}' 제조사 FAQ 추가 {counts['added']}개, 변경 {counts['modified']}개, "
+                  f"삭제 {counts['removed']}개, 변경 없음 {counts['unchanged']}개")
+
+        print(f"\n모든 파일 처리 완료. 추가 {total_counts['added']}개, 변경 {total_counts['modified']}개, "
+              f"삭제 {total_counts['removed']}개, 변경 없음 {total_counts['unchanged']}개")
+
+        # 3. 제조사 간 유사 중복 FAQ 클러스터링 (MinHash/LSH)
+        print("유사 중복 FAQ 클러스터링 중...")
+        faq_count, cluster_count = assign_faq_clusters(cursor)
+        conn.commit()
+        print(f"FAQ {faq_count}개 → 클러스터 {cluster_count}개")
+
+        # 4. FAQ 본문에 언급된 차량 모델 태깅 (Aho-Corasick 한 번의 스캔)
+        print("FAQ 차량 모델 태깅 중...")
+        tag_faq_models(cursor)
+        conn.commit()
 
-        print(f"\n모든 파일 처리 완료. 총 {total_inserted_count}개의 FAQ 데이터 삽입.")
+        # 5. 충전/배터리/화재·안전/보증 주제 태깅 (FAQ 페이지 필터용)
+        print("FAQ 주제 태깅 중...")
+        tag_faq_topics(cursor)
+        conn.commit()
 
     except Exception as e:
         print(f"오류 발생: {e}")
         if conn:
             conn.rollback() # 오류 발생 시 롤백
+        raise
     finally:
         if cursor:
             cursor.close()
@@ -0,0 +1,124 @@
+import re
+import zlib
+
+import numpy as np
+
+# --- 설정 ---
+# 문자 n-gram 길이 (한국어는 띄어쓰기가 불규칙해서 단어보다 문자 단위가 안정적)
+SHINGLE_SIZE = 3
+# MinHash 순열 개수 = BANDS * ROWS_PER_BAND
+NUM_PERM = 128
+BANDS = 32
+ROWS_PER_BAND = 4
+# LSH 후보 쌍 중 추정 Jaccard 유사도가 이 값 이상인 경우만 같은 클러스터로 묶습니다.
+SIMILARITY_THRESHOLD = 0.5
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64((1 << 32) - 1)
+
+
+def _make_permutations(num_perm, seed=42):
+    """MinHash에 사용할 (a, b) 해시 계수를 고정 시드로 생성합니다."""
+    rng = np.random.RandomState(seed)
+    a = rng.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+    b = rng.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64)
+    return a, b
+
+
+_PERM_A, _PERM_B = _make_permutations(NUM_PERM)
+
+
+def normalize_text(text):
+    """공백/특수문자를 정리하고 소문자로 바꿉니다."""
+    text = re.sub(r'[^\w\s]', ' ', text or '')
+    return re.sub(r'\s+', ' ', text).strip().lower()
+
+
+def shingles(text, size=SHINGLE_SIZE):
+    """정규화된 텍스트의 문자 n-gram 집합을 32비트 해시 배열로 반환합니다."""
+    text = normalize_text(text)
+    if len(text) <= size:
+        grams = {text} if text else set()
+    else:
+        grams = {text[i:i + size] for i in range(len(text) - size + 1)}
+    return np.fromiter((zlib.crc32(g.encode('utf-8')) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash_signature(text):
+    """텍스트 하나의 MinHash 시그니처(길이 NUM_PERM)를 계산합니다."""
+    hashed = shingles(text)
+    if hashed.size == 0:
+        return np.full(NUM_PERM, _MAX_HASH, dtype=np.uint64)
+    # (순열 개수 x shingle 개수) 행렬을 한 번에 계산한 뒤 행별 최소값을 취합니다.
+    phv = ((np.outer(_PERM_A, hashed) + _PERM_B[:, None]) % _MERSENNE_PRIME) & _MAX_HASH
+    return phv.min(axis=1)
+
+
+def cluster_near_duplicates(texts, threshold=SIMILARITY_THRESHOLD):
+    """
+    MinHash/LSH로 유사 중복 텍스트를 묶어 각 텍스트의 클러스터 대표 인덱스를 반환합니다.
+    대표 인덱스는 클러스터에서 가장 앞선 텍스트의 위치입니다.
+    """
+    n = len(texts)
+    if n == 0:
+        return []
+    signatures = np.vstack([minhash_signature(t) for t in texts])
+
+    # Union-Find
+    parent = list(range(n))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(i, j):
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            # 작은 인덱스를 대표로 유지
+            if ri < rj:
+                parent[rj] = ri
+            else:
+                parent[ri] = rj
+
+    # LSH: 밴드별로 버킷을 만들고, 같은 버킷에 들어간 항목끼리만 후보 쌍으로 비교합니다.
+    # 버킷의 첫 항목이 우연히 충돌한 것일 수 있으므로 버킷 안의 모든 쌍을 비교합니다. (버킷은 작습니다)
+    compared = set()
+    for band in range(BANDS):
+        start = band * ROWS_PER_BAND
+        buckets = {}
+        for idx, key in enumerate(map(bytes, signatures[:, start:start + ROWS_PER_BAND])):
+            buckets.setdefault(key, []).append(idx)
+        for members in buckets.values():
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    if (i, j) in compared or find(i) == find(j):
+                        continue
+                    compared.add((i, j))
+                    similarity = np.mean(signatures[i] == signatures[j])
+                    if similarity >= threshold:
+                        union(i, j)
+
+    return [find(i) for i in range(n)]
+
+
+def assign_faq_clusters(cursor):
+    """EV_Manufacturer_FAQ 전체를 읽어 cluster_id를 갱신하고 (전체 수, 클러스터 수)를 반환합니다."""
+    cursor.execute("SELECT id, question, answer, cluster_id FROM EV_Manufacturer_FAQ ORDER BY id")
+    rows = cursor.fetchall()
+    if not rows:
+        return 0, 0
+
+    texts = [f"{question} {answer}" for _, question, answer, _ in rows]
+    representatives = cluster_near_duplicates(texts)
+
+    updates = []
+    for (faq_id, _, _, current_cluster_id), rep in zip(rows, representatives):
+        cluster_id = rows[rep][0]
+        if cluster_id != current_cluster_id:
+            updates.append((cluster_id, faq_id))
+    if updates:
+        cursor.executemany("UPDATE EV_Manufacturer_FAQ SET cluster_id = %s WHERE id = %s", updates)
+
+    return len(rows), len(set(representatives))
@@ -0,0 +1,200 @@
+import difflib
+import hashlib
+import json
+
+from db.sql.faq_dedup import normalize_text
+
+# --- 설정 ---
+# 버전 1, 1+N, 1+2N ... 에는 전체 답변을 저장하고 나머지는 직전 버전 대비 delta만 저장합니다.
+# (특정 시점 복원 시 최대 N개 행만 읽으면 됩니다.)
+SNAPSHOT_INTERVAL = 10
+
+
+def faq_key(manufacturer_name, question, occurrence=0):
+    """제조사 + 정규화된 질문으로 만든 FAQ의 안정적인 키 (같은 질문이 여러 번 나오면 등장 순번 포함)."""
+    raw = f"{manufacturer_name}\x1f{normalize_text(question)}\x1f{occurrence}"
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def content_hash(question, answer):
+    """공백/특수문자 차이는 무시하는 답변 내용 해시."""
+    raw = f"{normalize_text(question)}\x1f{normalize_text(answer)}"
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def is_snapshot_version(version):
+    return (version - 1) % SNAPSHOT_INTERVAL == 0
+
+
+# --- delta 인코딩 ---
+def make_delta(old, new):
+    """old → new 변경을 [["=", 유지 길이], ["-", 삭제 길이], ["+", 삽입 문자열]] JSON으로 인코딩합니다."""
+    ops = []
+    for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes():
+        if tag == 'equal':
+            ops.append(['=', i2 - i1])
+            continue
+        if tag in ('delete', 'replace'):
+            ops.append(['-', i2 - i1])
+        if tag in ('insert', 'replace'):
+            ops.append(['+', new[j1:j2]])
+    return json.dumps(ops, ensure_ascii=False, separators=(',', ':'))
+
+
+def apply_delta(old, delta):
+    parts = []
+    pos = 0
+    for op, value in json.loads(delta):
+        if op == '=':
+            parts.append(old[pos:pos + value])
+            pos += value
+        elif op == '-':
+            pos += value
+        else:
+            parts.append(value)
+    return ''.join(parts)
+
+
+def rebuild_answer(version_rows):
+    """같은 FAQ의 (answer, delta) 행들을 버전 순서대로 받아 마지막 버전의 답변을 복원합니다."""
+    text = None
+    for answer, delta in version_rows:
+        if answer is not None:
+            text = answer
+        elif delta is not None:
+            text = apply_delta(text, delta)
+    return text
+
+
+# --- 적재 (변경된 FAQ만 기록) ---
+def sync_faqs(cursor, manufacturer_id, manufacturer_name, faqs, captured_at):
+    """
+    한 제조사의 스크랩 결과를 현재 FAQ와 비교해 변경분만 반영합니다.
+    새 FAQ / 내용이 바뀐 FAQ / 사라진 FAQ 마다 EV_FAQ_Version 에 버전을 추가하고,
+    내용이 같으면 아무것도 쓰지 않습니다. 반환값은 {'added', 'modified', 'removed', 'unchanged'} 개수입니다.
+    """
+    cursor.execute("""
+        SELECT id, faq_key, question, answer, content_hash, version
+        FROM EV_Manufacturer_FAQ WHERE manufacturer_id = %s
+    """, (manufacturer_id,))
+    current = {row[1]: row for row in cursor.fetchall()}
+    # 삭제 후 다시 나타난 FAQ의 다음 버전 번호용: 이 제조사 키들의 마지막 버전을 한 번에 읽습니다.
+    cursor.execute("""
+        SELECT faq_key, MAX(version) FROM EV_FAQ_Version WHERE manufacturer_id = %s GROUP BY faq_key
+    """, (manufacturer_id,))
+    last_versions = dict(cursor.fetchall())
+
+    counts = {'added': 0, 'modified': 0, 'removed': 0, 'unchanged': 0}
+    version_rows = []
+    seen_keys = set()
+    occurrences = {}
+
+    for question, answer in faqs:
+        normalized_question = normalize_text(question)
+        occurrence = occurrences.get(normalized_question, 0)
+        occurrences[normalized_question] = occurrence + 1
+
+        key = faq_key(manufacturer_name, question, occurrence)
+        seen_keys.add(key)
+        new_hash = content_hash(question, answer)
+
+        if key not in current:
+            # 삭제 후 다시 나타난 FAQ라면 이력의 다음 버전으로 이어서 기록 (전체 답변 저장)
+            version = last_versions.get(key, 0) + 1
+            cursor.execute("""
+                INSERT INTO EV_Manufacturer_FAQ
+                    (manufacturer_id, faq_key, question, answer, content_hash, version, captured_at)
+                VALUES (%s, %s, %s, %s, %s, %s, %s)
+            """, (manufacturer_id, key, question, answer, new_hash, version, captured_at))
+            version_rows.append((key, version, manufacturer_id, 'added', question, answer, None, new_hash, captured_at))
+            counts['added'] += 1
+            continue
+
+        faq_id, _, _, old_answer, old_hash, old_version = current[key]
+        if old_hash == new_hash:
+            counts['unchanged'] += 1
+            continue
+
+        version = old_version + 1
+        cursor.execute("""
+            UPDATE EV_Manufacturer_FAQ
+            SET question = %s, answer = %s, content_hash = %s, version = %s, captured_at = %s
+            WHERE id = %s
+        """, (question, answer, new_hash, version, captured_at, faq_id))
+        if is_snapshot_version(version):
+            version_rows.append((key, version, manufacturer_id, 'modified', question, answer, None, new_hash, captured_at))
+        else:
+            delta = make_delta(old_answer, answer)
+            version_rows.append((key, version, manufacturer_id, 'modified', question, None, delta, new_hash, captured_at))
+        counts['modified'] += 1
+
+    for key, (faq_id, _, question, old_answer, old_hash, old_version) in current.items():
+        if key in seen_keys:
+            continue
+        version = old_version + 1
+        # 삭제 버전도 스냅샷 위치라면 전체 답변을 남겨 delta 체인이 끊기지 않게 합니다.
+        snapshot_answer = old_answer if is_snapshot_version(version) else None
+        version_rows.append((key, version, manufacturer_id, 'removed', question, snapshot_answer, None, old_hash, captured_at))
+        cursor.execute("DELETE FROM EV_Manufacturer_FAQ WHERE id = %s", (faq_id,))
+        counts['removed'] += 1
+
+    if version_rows:
+        cursor.executemany("""
+            INSERT INTO EV_FAQ_Version
+                (faq_key, version, manufacturer_id, change_type, question, answer, delta, content_hash, captured_at)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+        """, version_rows)
+    return counts
+
+
+# --- 조회 API ---
+def faqs_as_of(cursor, as_of):
+    """
+    as_of 시점에 유효했던 FAQ 목록을 [{'faq_key', 'manufacturer_id', 'question', 'answer', 'version', 'captured_at'}] 로 반환합니다.
+    각 FAQ마다 가장 가까운 스냅샷부터 목표 버전까지만 읽습니다.
+    """
+    cursor.execute(f"""
+        SELECT v.faq_key, v.version, v.manufacturer_id, v.change_type, v.question, v.answer, v.delta, v.captured_at
+        FROM EV_FAQ_Version v
+        JOIN (
+            SELECT faq_key, MAX(version) AS target
+            FROM EV_FAQ_Version
+            WHERE captured_at <= %s
+            GROUP BY faq_key
+        ) t ON v.faq_key = t.faq_key
+        WHERE v.version BETWEEN t.target - MOD(t.target - 1, {SNAPSHOT_INTERVAL}) AND t.target
+        ORDER BY v.faq_key, v.version
+    """, (as_of,))
+
+    result = []
+    rows = cursor.fetchall()
+    start = 0
+    while start < len(rows):
+        end = start
+        while end < len(rows) and rows[end][0] == rows[start][0]:
+            end += 1
+        chain = rows[start:end]
+        faq_key_, version, manufacturer_id, change_type, question, _, _, captured_at = chain[-1]
+        if change_type != 'removed':
+            result.append({
+                'faq_key': faq_key_,
+                'manufacturer_id': manufacturer_id,
+                'question': question,
+                'answer': rebuild_answer([(row[5], row[6]) for row in chain]),
+                'version': version,
+                'captured_at': captured_at,
+            })
+        start = end
+    return result
+
+
+def faq_changes_since(cursor, since):
+    """since 이후의 변경 이력을 [{'faq_key', 'manufacturer_id', 'question', 'change_type', 'version', 'captured_at'}] 로 반환합니다."""
+    cursor.execute("""
+        SELECT faq_key, manufacturer_id, question, change_type, version, captured_at
+        FROM EV_FAQ_Version
+        WHERE captured_at > %s
+        ORDER BY captured_at, faq_key, version
+    """, (since,))
+    columns = ['faq_key', 'manufacturer_id', 'question', 'change_type', 'version', 'captured_at']
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
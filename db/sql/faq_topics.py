@@ -0,0 +1,42 @@
+from db.sql.model_matcher import AhoCorasick, normalize
+
+# --- 설정 ---
+# 주제별 키워드 (normalize 후 부분 문자열로 매칭하므로 공백 없이 적습니다)
+TOPIC_KEYWORDS = {
+    '충전': ['충전', '충전기', '완속', '급속', '콘센트', '케이블', '커넥터', '충전구', 'charging', 'charger'],
+    '배터리': ['배터리', '고전압', 'bms', '방전', '열관리', '배터리팩', 'battery'],
+    '화재/안전': ['화재', '발화', '열폭주', '소화', '연기', '침수', '충돌', '감전', '안전', '사고', 'fire'],
+    '보증': ['보증', '무상', '수리', '교체', '리콜', '서비스센터', '정비', 'warranty'],
+}
+
+
+def build_topic_matcher(topic_keywords=TOPIC_KEYWORDS):
+    matcher = AhoCorasick()
+    for topic, keywords in topic_keywords.items():
+        for keyword in keywords:
+            matcher.add(normalize(keyword), topic)
+    return matcher.build()
+
+
+def classify_topics(matcher, texts):
+    """각 텍스트를 한 번씩 스캔해 해당하는 주제 집합 목록을 반환합니다."""
+    return [matcher.find_all(normalize(text)) for text in texts]
+
+
+def tag_faq_topics(cursor):
+    """모든 FAQ의 주제를 다시 분류하고 EV_FAQ_Topic 에 달라진 부분만 반영합니다."""
+    cursor.execute("SELECT id, question, answer FROM EV_Manufacturer_FAQ")
+    rows = cursor.fetchall()
+    topics = classify_topics(build_topic_matcher(), [f"{question} {answer}" for _, question, answer in rows])
+
+    cursor.execute("SELECT faq_id, topic FROM EV_FAQ_Topic")
+    existing = set(cursor.fetchall())
+    desired = {(faq_id, topic) for (faq_id, _, _), faq_topics in zip(rows, topics) for topic in faq_topics}
+
+    stale = sorted(existing - desired)
+    new = sorted(desired - existing)
+    if stale:
+        cursor.executemany("DELETE FROM EV_FAQ_Topic WHERE faq_id = %s AND topic = %s", stale)
+    if new:
+        cursor.executemany("INSERT INTO EV_FAQ_Topic (faq_id, topic) VALUES (%s, %s)", new)
+    print(f"FAQ {len(rows)}개에서 주제 {len(desired)}건 태깅 완료 (추가 {len(new)}, 삭제 {len(stale)}).")
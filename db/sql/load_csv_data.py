@@ -1,14 +1,16 @@
-import csv
-import sys
+import glob
+import re
 import os
 
-# Add the parent directory to the Python path to enable importing connection.py
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pandas as pd
 
-from connection import get_connection
+from db.connection import get_connection
+from db.sql.model_matcher import MODEL_CATALOG_PATH, read_model_catalog
+from db.sql.typed_csv import EV_FIRE_CASE_SCHEMA, FIRE_INCIDENT_SCHEMA, read_typed_csv, to_db_rows
 
 # Base path for datasets
 DATASET_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'datasets')
+REGISTRATION_FILE_PATTERN = 'Vehicles_*.csv'
 
 def get_or_create_manufacturer_id(cursor, manufacturer_name):
     cursor.execute("SELECT id FROM EV_Manufacturer WHERE name = %s", (manufacturer_name,))
@@ -20,90 +22,168 @@ def get_or_create_manufacturer_id(cursor, manufacturer_name):
         cursor.execute("INSERT INTO EV_Manufacturer (name) VALUES (%s)", (manufacturer_name,))
         return cursor.lastrowid
 
-def load_total_fire_incidents(cursor):
-    file_path = os.path.join(DATASET_PATH, '소방청_차량화재통계.csv')
-    print(f"Processing {file_path}...")
+def load_model_catalog(cursor):
+    print(f"Processing {MODEL_CATALOG_PATH}...")
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)  # Skip header
-            
-            # Aggregate counts by year
-            fire_counts_by_year = {}
-            for row in reader:
-                year = int(row[0])
-                fire_counts_by_year[year] = fire_counts_by_year.get(year, 0) + 1
-
-            sql = "INSERT IGNORE INTO total_fire_incidents (year, count) VALUES (%s, %s)"
-            total_inserted = 0
-            for year, count in fire_counts_by_year.items():
-                cursor.execute(sql, (year, count))
-                total_inserted += cursor.rowcount
-            print(f"Inserted {total_inserted} rows into total_fire_incidents.")
-            
+        catalog = read_model_catalog()
+        manufacturer_ids = {}
+        for manufacturer_name, _ in catalog:
+            if manufacturer_name not in manufacturer_ids:
+                manufacturer_ids[manufacturer_name] = get_or_create_manufacturer_id(cursor, manufacturer_name)
+
+        sql = "INSERT IGNORE INTO EV_Model (manufacturer_id, name) VALUES (%s, %s)"
+        cursor.executemany(sql, [(manufacturer_ids[m], model) for m, model in catalog])
+        print(f"Inserted {cursor.rowcount} rows into EV_Model.")
+
     except FileNotFoundError:
-        print(f"Error: File not found at {file_path}")
+        print(f"Error: File not found at {MODEL_CATALOG_PATH}")
+        raise
     except Exception as e:
-        print(f"An error occurred while processing {file_path}: {e}")
+        print(f"An error occurred while processing {MODEL_CATALOG_PATH}: {e}")
+        raise
 
-def load_vehicle_registrations(cursor):
-    file_path = os.path.join(DATASET_PATH, 'Vehicles_2021-2023.csv')
+def _upsert_typed_rows(cursor, table, schema, df):
+    columns = schema.table_columns
+    updates = ', '.join(f"{c} = VALUES({c})" for c in columns if c != 'year')
+    sql = (f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(['%s'] * len(columns))}) "
+           f"ON DUPLICATE KEY UPDATE {updates}")
+    cursor.executemany(sql, to_db_rows(df))
+    return len(df)
+
+def load_total_fire_incidents(cursor):
+    file_path = os.path.join(DATASET_PATH, FIRE_INCIDENT_SCHEMA.file_name)
     print(f"Processing {file_path}...")
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader) # 'ID', '연료', '2021', '2022', '2023', 'source_url'
-            years = [int(y) for y in header[2:5]] # Years are at index 2, 3, 4
-
-            sql = "INSERT IGNORE INTO vehicle_registrations (year, fuel_type, count, source_url) VALUES (%s, %s, %s, %s)"
-            total_inserted = 0
-            for row in reader:
-                fuel_type = row[1]
-                # No need to skip '계' as the new file only contains EV, ICE, 총계
-                counts = [int(c) for c in row[2:5]] # Counts are at index 2, 3, 4
-                source_url = row[5] # Source URL is at index 5
-                for i, year in enumerate(years):
-                    cursor.execute(sql, (year, fuel_type, counts[i], source_url))
-                    total_inserted += cursor.rowcount
-            print(f"Inserted {total_inserted} rows into vehicle_registrations.")
+        df, rejected = read_typed_csv(file_path, FIRE_INCIDENT_SCHEMA)
+        total_inserted = _upsert_typed_rows(cursor, 'total_fire_incidents', FIRE_INCIDENT_SCHEMA, df)
+        print(f"Upserted {total_inserted} rows into total_fire_incidents ({rejected} rejected).")
 
     except FileNotFoundError:
         print(f"Error: File not found at {file_path}")
+        raise
     except Exception as e:
         print(f"An error occurred while processing {file_path}: {e}")
+        raise
+
+# Column names recognised in registration files (wide format: one column per period)
+FUEL_COLUMNS = ('연료', '연료별', 'fuel_type', 'fuel')
+REGION_COLUMNS = ('지역', '시도', '시도별', 'region')
+SOURCE_COLUMNS = ('source_url', '출처')
+NATIONAL_REGION = '전국'
+ANNUAL_MONTH = 0  # month value used for yearly figures
+
+FUEL_TYPE_ALIASES = {
+    '전기': 'EV', '전기차': 'EV',
+    '내연기관': 'ICE', '내연기관차': 'ICE',
+    '하이브리드': 'HYBRID', 'hybrid': 'HYBRID',
+    '수소': 'HYDROGEN', '수소전기': 'HYDROGEN', 'hydrogen': 'HYDROGEN',
+}
+
+# '2021', '2021-01', '2021.1', '202101', '2021년 1월'
+PERIOD_PATTERN = re.compile(r'^\s*(\d{4})\s*(?:년)?\s*(?:[-./]?\s*(\d{1,2})\s*(?:월)?)?\s*$')
+
+def parse_period(label):
+    """Return (year, month) for a period column header, or None if it is not a period."""
+    match = PERIOD_PATTERN.match(str(label))
+    if not match:
+        return None
+    year, month = int(match.group(1)), match.group(2)
+    if month is None:
+        return year, ANNUAL_MONTH
+    month = int(month)
+    return (year, month) if 1 <= month <= 12 else None
+
+def detect_period_columns(columns):
+    """Map every period column header to its (year, month)."""
+    periods = {}
+    for column in columns:
+        period = parse_period(column)
+        if period:
+            periods[column] = period
+    return periods
+
+def _find_column(columns, candidates):
+    for column in columns:
+        if str(column).strip().lower() in candidates:
+            return column
+    return None
+
+def melt_registrations(chunk, period_columns, fuel_column, region_column=None, source_column=None):
+    """Reshape one wide chunk to long rows of (year, month, fuel_type, region, count, source_url)."""
+    id_vars = [c for c in (fuel_column, region_column, source_column) if c]
+    long_df = chunk.melt(id_vars=id_vars, value_vars=list(period_columns), var_name='period', value_name='count')
+    long_df = long_df.dropna(subset=['count'])
+
+    long_df['year'] = long_df['period'].map({c: p[0] for c, p in period_columns.items()})
+    long_df['month'] = long_df['period'].map({c: p[1] for c, p in period_columns.items()})
+    fuel = long_df[fuel_column].astype(str).str.strip()
+    # Alias keys are lower-case, so one dict map on the lower-cased column; unknown fuels keep their label
+    long_df['fuel_type'] = fuel.str.lower().map(FUEL_TYPE_ALIASES).fillna(fuel)
+    long_df['region'] = long_df[region_column].astype(str).str.strip() if region_column else NATIONAL_REGION
+    long_df['source_url'] = long_df[source_column] if source_column else None
+    long_df['count'] = long_df['count'].astype('int64')
+
+    long_df = long_df[['year', 'month', 'fuel_type', 'region', 'count', 'source_url']]
+    return long_df.astype(object).where(long_df.notna(), None)
+
+def load_vehicle_registrations(cursor, file_paths=None, chunksize=50000):
+    """Load every wide registration file, detecting its period columns from the header."""
+    if file_paths is None:
+        file_paths = sorted(glob.glob(os.path.join(DATASET_PATH, REGISTRATION_FILE_PATTERN)))
+
+    sql = """
+    INSERT INTO vehicle_registrations (year, month, fuel_type, region, count, source_url)
+    VALUES (%s, %s, %s, %s, %s, %s)
+    ON DUPLICATE KEY UPDATE count = VALUES(count), source_url = VALUES(source_url)
+    """
+    for file_path in file_paths:
+        print(f"Processing {file_path}...")
+        try:
+            header = pd.read_csv(file_path, nrows=0, encoding='utf-8-sig').columns
+            period_columns = detect_period_columns(header)
+            fuel_column = _find_column(header, FUEL_COLUMNS)
+            if not period_columns or fuel_column is None:
+                raise ValueError(f"No fuel/period columns found in header: {list(header)}")
+            region_column = _find_column(header, REGION_COLUMNS)
+            source_column = _find_column(header, SOURCE_COLUMNS)
+
+            dtypes = {c: 'string' for c in (fuel_column, region_column, source_column) if c}
+            dtypes.update({c: 'float64' for c in period_columns})
+            usecols = list(dtypes)
+
+            total_rows = 0
+            # Stream the file so memory stays bounded regardless of how many rows/periods it has
+            for chunk in pd.read_csv(file_path, usecols=usecols, dtype=dtypes, thousands=',',
+                                     chunksize=chunksize, encoding='utf-8-sig'):
+                long_df = melt_registrations(chunk, period_columns, fuel_column, region_column, source_column)
+                if long_df.empty:
+                    continue
+                cursor.executemany(sql, list(long_df.itertuples(index=False, name=None)))
+                total_rows += len(long_df)
+            print(f"Upserted {total_rows} rows into vehicle_registrations "
+                  f"({len(period_columns)} periods).")
+
+        except FileNotFoundError:
+            print(f"Error: File not found at {file_path}")
+            raise
+        except Exception as e:
+            print(f"An error occurred while processing {file_path}: {e}")
+            raise
 
 def load_ev_fire_cases(cursor):
-    file_path = os.path.join(DATASET_PATH, '전기차 화재 발생 현황.csv')
+    file_path = os.path.join(DATASET_PATH, EV_FIRE_CASE_SCHEMA.file_name)
     print(f"Processing {file_path}...")
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            header = next(reader)  # Skip header
-
-            sql = """
-            INSERT IGNORE INTO ev_fire_cases (year, manufacturer_id, model, ignition_point, situation, battery_supplier)
-            VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            total_inserted = 0
-            for row in reader:
-                year = int(row[0])
-                manufacturer_name = row[1]
-                model = row[2]
-                ignition_point = row[3]
-                situation = row[4]
-                battery_supplier = row[5]
-
-                manufacturer_id = get_or_create_manufacturer_id(cursor, manufacturer_name)
-
-                values = (year, manufacturer_id, model, ignition_point, situation, battery_supplier)
-                cursor.execute(sql, values)
-                total_inserted += cursor.rowcount
-            print(f"Inserted {total_inserted} rows into ev_fire_cases.")
+        df, rejected = read_typed_csv(file_path, EV_FIRE_CASE_SCHEMA)
+        total_inserted = _upsert_typed_rows(cursor, 'ev_fire_cases', EV_FIRE_CASE_SCHEMA, df)
+        print(f"Upserted {total_inserted} rows into ev_fire_cases ({rejected} rejected).")
 
     except FileNotFoundError:
         print(f"Error: File not found at {file_path}")
+        raise
     except Exception as e:
         print(f"An error occurred while processing {file_path}: {e}")
+        raise
 
 def main():
     conn = None
@@ -111,6 +191,7 @@ def main():
         conn = get_connection()
         if conn:
             cursor = conn.cursor()
+            load_model_catalog(cursor)
             load_total_fire_incidents(cursor)
             load_vehicle_registrations(cursor)
             load_ev_fire_cases(cursor)
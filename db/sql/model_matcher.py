@@ -0,0 +1,229 @@
+import csv
+import os
+import re
+from collections import deque
+
+# --- 설정 ---
+MODEL_CATALOG_PATH = os.path.join(
+    os.path.dirname(__file__), '..', '..', 'datasets',
+    '한국전력공사_전기차량 제조사별 모델 정보_20250630.csv'
+)
+# 카탈로그 모델명 중 일반 단어와 겹치는 별칭 규칙 (alias, rule, note)
+# - stopword: 매칭하지 않음
+# - ambiguous: 같은 제조사가 본문에 함께 언급될 때만 인정
+MODEL_ALIAS_RULES_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'datasets', 'model_alias_rules.csv')
+
+# 파일명/본문에 등장하는 영문·약칭 → 카탈로그의 제조사명
+MANUFACTURER_ALIASES = {
+    '현대자동차': ['현대', 'hyundai'],
+    '기아자동차': ['기아', 'kia'],
+    '르노코리아': ['르노', 'renault'],
+    '쉐보레': ['chevrolet', 'chevy'],
+    '테슬라': ['tesla'],
+    '벤츠': ['benz', 'mercedes'],
+    '볼보': ['volvo'],
+    '폭스바겐': ['volkswagen'],
+    '포르쉐': ['porsche'],
+}
+
+# 본문에서 모델명과 함께 쓰이는 영문 표기 (예: "테슬라 모델 Y" ↔ "Model Y")
+_TRANSLITERATIONS = [
+    ('모델', 'model'),
+    ('볼트', 'bolt'),
+    ('아이오닉', 'ioniq'),
+    ('코나', 'kona'),
+    ('니로', 'niro'),
+]
+
+# 어느 카탈로그에서나 너무 포괄적이라 오탐이 많은 별칭
+_ALIAS_STOPWORDS = {'ev', 'phev', '기타'}
+
+_SEPARATOR = re.compile(r'[\s_\-·]')
+
+
+def normalize(text):
+    """매칭용 정규화: 소문자 변환 후 공백/구분자를 제거합니다."""
+    return re.sub(r'[\s_\-·]+', '', (text or '').lower())
+
+
+def normalize_with_offsets(text):
+    """normalize 와 같은 문자열과, 그 각 글자가 원문의 몇 번째 글자에서 왔는지 목록을 반환합니다."""
+    chars, offsets = [], []
+    for pos, ch in enumerate(text or ''):
+        if _SEPARATOR.match(ch):
+            continue
+        for lowered in ch.lower():
+            chars.append(lowered)
+            offsets.append(pos)
+    return ''.join(chars), offsets
+
+
+def _is_ascii_alnum(ch):
+    return ch.isascii() and ch.isalnum()
+
+
+class AhoCorasick:
+    """여러 패턴을 한 번의 선형 스캔으로 찾는 Aho-Corasick 오토마톤."""
+
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._built = False
+
+    def add(self, pattern, value):
+        if not pattern:
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append(value)
+        self._built = False
+
+    def build(self):
+        """BFS로 실패 링크를 만들고, 실패 경로의 출력을 미리 합쳐 둡니다."""
+        queue = deque(self._goto[0].values())
+        for child in queue:
+            self._fail[child] = 0
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+        self._built = True
+        return self
+
+    def iter_matches(self, text):
+        """(끝 위치, 값) 튜플을 텍스트 등장 순서대로 반환합니다."""
+        if not self._built:
+            self.build()
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for value in output[node]:
+                yield pos, value
+
+    def find_all(self, text):
+        """텍스트에 등장하는 모든 값의 집합을 반환합니다."""
+        return {value for _, value in self.iter_matches(text)}
+
+
+def model_aliases(manufacturer_name, model_name, stopwords=()):
+    """카탈로그 모델명 하나에서 본문 매칭에 쓸 별칭들을 만듭니다. stopwords 의 별칭은 뺍니다."""
+    base = re.sub(r'\([^)]*년형[^)]*\)', '', model_name).strip()
+    candidates = {base}
+    # "테슬라 모델 Y" → "모델 Y", "폭스바겐ID.4" → "ID.4"
+    for prefix in [manufacturer_name] + MANUFACTURER_ALIASES.get(manufacturer_name, []):
+        if base.lower().startswith(prefix.lower()) and len(base) > len(prefix):
+            candidates.add(base[len(prefix):])
+    for korean, english in _TRANSLITERATIONS:
+        candidates |= {c.replace(korean, english) for c in candidates if korean in c}
+
+    aliases = {normalize(c) for c in candidates}
+    stopwords = _ALIAS_STOPWORDS | set(stopwords)
+    return {a for a in aliases if len(a) >= 2 and a not in stopwords}
+
+
+def read_model_catalog(file_path=MODEL_CATALOG_PATH):
+    """KEPCO 모델 카탈로그 CSV를 (제조사, 모델명) 목록으로 읽습니다."""
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        reader = csv.reader(f)
+        next(reader)  # 제조사,모델명
+        return [(row[0].strip(), row[1].strip()) for row in reader if len(row) >= 2 and row[1].strip()]
+
+
+def read_alias_rules(file_path=MODEL_ALIAS_RULES_PATH):
+    """별칭 규칙 CSV를 {'stopword': 별칭 집합, 'ambiguous': 별칭 집합} 으로 읽습니다. (별칭은 normalize 결과)"""
+    rules = {'stopword': set(), 'ambiguous': set()}
+    with open(file_path, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            rule = row['rule'].strip()
+            if rule not in rules:
+                raise ValueError(f"알 수 없는 별칭 규칙: {rule} ({row['alias']})")
+            rules[rule].add(normalize(row['alias']))
+    return rules
+
+
+class ModelMatcher:
+    """
+    본문에서 언급된 model_id 를 찾는 매처. 정규화된 본문을 Aho-Corasick으로 한 번 스캔한 뒤
+    - 영문/숫자로 시작(끝)나는 별칭은 원문에서 앞(뒤) 글자도 영문/숫자면 버리고 ("Type 6" 의 E6, "XML" 의 XM)
+    - ambiguous 별칭은 같은 제조사가 함께 언급된 경우에만 인정합니다. ("스파크" 는 "쉐보레 스파크" 일 때만)
+    """
+
+    def __init__(self, models, alias_rules=None):
+        rules = alias_rules if alias_rules is not None else read_alias_rules()
+        self._aliases = AhoCorasick()
+        manufacturer_names = set()
+        for model_id, manufacturer_name, model_name in models:
+            manufacturer_names.add(manufacturer_name)
+            for alias in model_aliases(manufacturer_name, model_name, rules['stopword']):
+                required_manufacturer = manufacturer_name if alias in rules['ambiguous'] else None
+                self._aliases.add(alias, (model_id, len(alias), required_manufacturer))
+        self._aliases.build()
+        self._manufacturers = build_manufacturer_matcher(manufacturer_names)
+
+    def find_models(self, text):
+        normalized, offsets = normalize_with_offsets(text)
+        found = set()
+        mentioned_manufacturers = None
+        for end, (model_id, length, required_manufacturer) in self._aliases.iter_matches(normalized):
+            if model_id in found:
+                continue
+            start = end - length + 1
+            if _is_ascii_alnum(normalized[start]) and offsets[start] > 0 \
+                    and _is_ascii_alnum(text[offsets[start] - 1]):
+                continue
+            if _is_ascii_alnum(normalized[end]) and offsets[end] + 1 < len(text) \
+                    and _is_ascii_alnum(text[offsets[end] + 1]):
+                continue
+            if required_manufacturer:
+                if mentioned_manufacturers is None:
+                    mentioned_manufacturers = self._manufacturers.find_all(normalized)
+                if required_manufacturer not in mentioned_manufacturers:
+                    continue
+            found.add(model_id)
+        return found
+
+
+def build_model_matcher(models, alias_rules=None):
+    """(model_id, 제조사명, 모델명) 목록으로 모델 매처를 만듭니다."""
+    return ModelMatcher(models, alias_rules)
+
+
+def build_manufacturer_matcher(manufacturer_names):
+    """제조사명과 영문 별칭으로 제조사 매처를 만듭니다. 값은 카탈로그 제조사명입니다."""
+    matcher = AhoCorasick()
+    for name in manufacturer_names:
+        for alias in [name] + MANUFACTURER_ALIASES.get(name, []):
+            matcher.add(normalize(alias), name)
+    return matcher.build()
+
+
+def fetch_model_matcher(cursor):
+    """EV_Model 테이블에서 모델 매처를 만듭니다."""
+    cursor.execute("""
+        SELECT md.id, m.name, md.name
+        FROM EV_Model md
+        JOIN EV_Manufacturer m ON md.manufacturer_id = m.id
+    """)
+    return build_model_matcher(cursor.fetchall())
+
+
+def tag_texts(matcher, texts):
+    """각 텍스트를 한 번씩 스캔하고, 언급된 model_id 집합 목록을 반환합니다."""
+    return [matcher.find_models(text) for text in texts]
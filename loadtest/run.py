@@ -0,0 +1,206 @@
+import argparse
+import importlib
+import multiprocessing
+import os
+import queue
+import sys
+import time
+
+import numpy as np
+
+from loadtest.stand_in_db import FAQ_TOPICS, StandInDatabase, shared_counters
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# --- 설정 ---
+PAGES = {
+    'home': os.path.join(ROOT_DIR, 'home.py'),
+    'statistics': os.path.join(ROOT_DIR, 'pages', 'statistics.py'),
+    'faq': os.path.join(ROOT_DIR, 'pages', '❓_FAQ.py'),
+}
+# 세션 하나가 스크립트를 다시 실행하는 최대 시간(초)
+RERUN_TIMEOUT = 60
+# 모든 세션 프로세스가 준비될 때까지 기다리는 최대 시간(초). 프로세스마다 Streamlit 을 새로 임포트합니다.
+START_TIMEOUT = 120
+# 메모리 기준점을 재기 전에 미리 임포트하는 모듈. 인터프리터/라이브러리 임포트 비용을 세션 메모리에서 뺍니다.
+WARMUP_MODULES = ['streamlit', 'streamlit.testing.v1', 'pandas', 'numpy', 'altair',
+                  'db.connection', 'analytics.fire_data', 'analytics.fire_rates', 'search.autocomplete', 'search.facets']
+# 세션 프로세스 시작 방식. Streamlit 런타임은 프로세스 전역 싱글턴이라 세션마다 새 인터프리터를 씁니다.
+START_METHOD = 'spawn'
+
+
+def _rss_bytes():
+    """현재 프로세스의 RSS. /proc 이 없으면 최대 RSS 로 대신합니다."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def latency_summary(latencies):
+    """재실행 지연(초) 목록의 p50/p95/p99/max (밀리초)."""
+    if not latencies:
+        return {'runs': 0, 'p50': None, 'p95': None, 'p99': None, 'max': None}
+    p50, p95, p99 = np.percentile(np.asarray(latencies) * 1000, [50, 95, 99])
+    return {'runs': len(latencies), 'p50': p50, 'p95': p95, 'p99': p99, 'max': max(latencies) * 1000}
+
+
+def run_session(page, reruns, start_barrier, session_no):
+    """
+    헤드리스 세션 하나: 페이지를 처음 실행한 뒤 reruns 번 다시 실행합니다.
+    FAQ 페이지는 검색어를 바꿔 가며 입력합니다. 반환값은 (AppTest, 지연 목록, 오류 목록) 입니다.
+    """
+    from streamlit.testing.v1 import AppTest  # 부하 테스트를 돌릴 때만 임포트
+
+    at = AppTest.from_file(PAGES[page], default_timeout=RERUN_TIMEOUT)
+    latencies, errors = [], []
+    start_barrier.wait()
+    for i in range(reruns + 1):
+        if i > 0 and page == 'faq' and at.text_input:
+            at.text_input[0].input(FAQ_TOPICS[(session_no + i) % len(FAQ_TOPICS)])
+        started = time.perf_counter()
+        try:
+            at.run()
+        except Exception as e:
+            errors.append(repr(e))
+            break
+        latencies.append(time.perf_counter() - started)
+        errors += [str(exc.message) for exc in at.exception]
+    return at, latencies, errors
+
+
+def _warm_up_imports():
+    """WARMUP_MODULES 를 임포트합니다. 설치되지 않은 모듈은 건너뜁니다. (가짜 세션으로 돌리는 테스트 등)"""
+    for module in WARMUP_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass
+
+
+def _session_process(session, page, reruns, session_no, db_path, db_latency_ms, counters, start_barrier, results):
+    """
+    세션 프로세스: 공유 SQLite 파일과 공유 연결 카운터로 가짜 DB를 설치하고 session 을 실행한 뒤
+    (세션 번호, 지연 목록, 오류 목록, RSS 증가분)을 results 큐로 보냅니다.
+    기준 RSS 는 페이지가 쓰는 라이브러리를 미리 임포트한 뒤에 재고, 끝 RSS 는 세션 객체가 살아 있을 때 재므로
+    증가분이 곧 세션 하나(스크립트 실행 상태, 캐시, 위젯)의 메모리입니다.
+    """
+    if ROOT_DIR not in sys.path:
+        sys.path.insert(0, ROOT_DIR)  # 페이지의 `from db import ...` 용
+    _warm_up_imports()
+
+    database = StandInDatabase(latency_ms=db_latency_ms, path=db_path, counters=counters)
+    database.install()
+    latencies, errors = [], []
+    rss_before = _rss_bytes()
+    try:
+        app, latencies, errors = session(page, reruns, start_barrier, session_no)
+        rss_after = _rss_bytes()
+        del app
+    except Exception as e:
+        start_barrier.abort()  # 다른 세션이 시작 대기에서 멈추지 않도록
+        errors.append(repr(e))
+        rss_after = rss_before
+    finally:
+        database.close()
+    results.put((session_no, latencies, errors, max(rss_after - rss_before, 0)))
+
+
+def run_load_test(users=50, pages=tuple(PAGES), reruns=3, faq_count=2000, db_latency_ms=5, session=run_session):
+    """
+    users 개의 세션을 각자의 프로세스에서 동시에 시작해 pages 를 번갈아 배정하고 결과 dict를 반환합니다.
+    DB 연결 수는 모든 프로세스가 공유하는 카운터로 셉니다. 다만 세션마다 프로세스가 달라 st.cache_data 를
+    공유하지 못하므로, 이 동시 최대값(peak_connections_across_processes)은 서버 한 대가 여는 연결 수보다 큰
+    상한값입니다. 세션당 메모리는 프로세스별 RSS 증가분의 평균입니다.
+    session 은 run_session 과 같은 형식의 모듈 수준 함수여야 합니다. (spawn 으로 전달)
+    """
+    context = multiprocessing.get_context(START_METHOD)
+    assignments = [pages[i % len(pages)] for i in range(users)]
+    start_barrier = context.Barrier(users, timeout=START_TIMEOUT)
+    results = context.Queue()
+
+    database = StandInDatabase(faq_count=faq_count, latency_ms=db_latency_ms, counters=shared_counters(context))
+    try:
+        processes = [context.Process(target=_session_process,
+                                     args=(session, page, reruns, i, database.path, db_latency_ms,
+                                           database.counters, start_barrier, results))
+                     for i, page in enumerate(assignments)]
+        started = time.perf_counter()
+        for process in processes:
+            process.start()
+
+        outcomes = {}
+        deadline = time.monotonic() + START_TIMEOUT + RERUN_TIMEOUT * (reruns + 1)
+        while len(outcomes) < users:
+            try:
+                session_no, latencies, errors, rss_growth = results.get(timeout=1)
+                outcomes[session_no] = (latencies, errors, rss_growth)
+            except queue.Empty:
+                # 결과를 보내지 못하고 죽은 프로세스가 있거나 시간이 다 되면 기다리지 않습니다.
+                if time.monotonic() > deadline or not any(process.is_alive() for process in processes):
+                    break
+        for process in processes:
+            process.join(timeout=RERUN_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        elapsed = time.perf_counter() - started
+
+        for i in range(users):
+            if i not in outcomes:
+                outcomes[i] = ([], [f"세션 프로세스 {i}가 결과 없이 종료되었습니다. (exitcode={processes[i].exitcode})"], 0)
+
+        report = {
+            'users': users,
+            'elapsed_seconds': elapsed,
+            'peak_connections_across_processes': database.peak_connections,
+            'total_connections': database.total_connections,
+            'leaked_connections': database.open_connections,
+            'memory_per_session_mb': sum(rss for _, _, rss in outcomes.values()) / users / 2 ** 20,
+            'pages': {},
+        }
+        for page in pages:
+            page_results = [outcomes[i] for i, p in enumerate(assignments) if p == page]
+            summary = latency_summary([latency for latencies, _, _ in page_results for latency in latencies])
+            summary['errors'] = [error for _, errors, _ in page_results for error in errors]
+            report['pages'][page] = summary
+    finally:
+        database.close()
+    return report
+
+
+def print_report(report):
+    print(f"\n--- 부하 테스트 결과: 동시 세션 {report['users']}개, {report['elapsed_seconds']:.1f}초 ---")
+    print(f"{'페이지':<12}{'실행':>6}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}{'오류':>6}")
+    for page, s in report['pages'].items():
+        if not s['runs']:
+            print(f"{page:<12}{0:>6}{'-':>10}{'-':>10}{'-':>10}{'-':>10}{len(s['errors']):>6}")
+            continue
+        print(f"{page:<12}{s['runs']:>6}{s['p50']:>10.0f}{s['p95']:>10.0f}{s['p99']:>10.0f}{s['max']:>10.0f}"
+              f"{len(s['errors']):>6}")
+    print(f"DB 연결: 전체 세션 프로세스 동시 최대 {report['peak_connections_across_processes']}개,"
+          f" 총 {report['total_connections']}회 (닫히지 않은 연결 {report['leaked_connections']}개)")
+    print("  ※ 세션마다 프로세스가 달라 캐시를 공유하지 않으므로 실제 서버 한 대보다 연결 수가 많게 나옵니다.")
+    print(f"세션당 메모리: {report['memory_per_session_mb']:.1f} MB")
+    for page, s in report['pages'].items():
+        for error in sorted(set(s['errors']))[:3]:
+            print(f"[{page}] {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Streamlit 페이지를 동시 세션으로 실행해 지연/DB 연결/메모리를 측정합니다.")
+    parser.add_argument('--users', type=int, default=50, help="동시 세션 수")
+    parser.add_argument('--pages', nargs='+', choices=list(PAGES), default=list(PAGES), help="세션에 번갈아 배정할 페이지")
+    parser.add_argument('--reruns', type=int, default=3, help="세션마다 첫 실행 후 다시 실행하는 횟수")
+    parser.add_argument('--faqs', type=int, default=2000, help="가짜 DB의 FAQ 개수")
+    parser.add_argument('--db-latency-ms', type=float, default=5, help="쿼리마다 더할 지연(ms)")
+    args = parser.parse_args()
+
+    report = run_load_test(users=args.users, pages=args.pages, reruns=args.reruns,
+                           faq_count=args.faqs, db_latency_ms=args.db_latency_ms)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+import multiprocessing
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from db import connection as db_connection
+
+# 페이지가 조회하는 컬럼만 담은 SQLite 스키마 (create_tables.py 의 MySQL 스키마를 축약)
+SCHEMA = """
+CREATE TABLE EV_Manufacturer (id INTEGER PRIMARY KEY, name TEXT UNIQUE);
+CREATE TABLE EV_Model (id INTEGER PRIMARY KEY, manufacturer_id INTEGER, name TEXT);
+CREATE TABLE EV_Manufacturer_FAQ (
+    id INTEGER PRIMARY KEY, manufacturer_id INTEGER, question TEXT, answer TEXT,
+    cluster_id INTEGER, version INTEGER DEFAULT 1, captured_at TEXT
+);
+CREATE TABLE EV_FAQ_Model_Mention (faq_id INTEGER, model_id INTEGER, PRIMARY KEY (faq_id, model_id));
+CREATE TABLE EV_FAQ_Topic (faq_id INTEGER, topic TEXT, PRIMARY KEY (faq_id, topic));
+CREATE TABLE vehicle_registrations (
+    year INTEGER, month INTEGER DEFAULT 0, fuel_type TEXT, region TEXT DEFAULT '전국', count INTEGER, source_url TEXT
+);
+CREATE TABLE total_fire_incidents (
+    year INTEGER PRIMARY KEY, total_fires INTEGER, general_road INTEGER, highway INTEGER,
+    other_road INTEGER, parking_lot INTEGER, vacant_lot INTEGER, tunnel INTEGER
+);
+CREATE TABLE ev_fire_cases (
+    year INTEGER PRIMARY KEY, total_fires INTEGER, total_casualties INTEGER,
+    deaths INTEGER, injuries INTEGER, property_damage_krw INTEGER
+);
+"""
+
+MANUFACTURERS = ['기아', '쉐보레', '테슬라', '현대']
+FAQ_TOPICS = ['충전', '배터리', '화재', '보증', '주행거리', '정비', '침수', '겨울철']
+# 제조사별 가짜 모델 이름 (모델 언급 패싯용)
+MODELS_PER_MANUFACTURER = 3
+
+
+def _seed(conn, faq_count, rng):
+    conn.executescript(SCHEMA)
+    conn.executemany("INSERT INTO EV_Manufacturer (id, name) VALUES (?, ?)", list(enumerate(MANUFACTURERS, 1)))
+
+    models = [(m * MODELS_PER_MANUFACTURER + n + 1, m + 1, f"{name} EV{n + 1}")
+              for m, name in enumerate(MANUFACTURERS) for n in range(MODELS_PER_MANUFACTURER)]
+    conn.executemany("INSERT INTO EV_Model (id, manufacturer_id, name) VALUES (?, ?, ?)", models)
+
+    faqs, topics, mentions = [], [], []
+    for i in range(1, faq_count + 1):
+        topic = rng.choice(FAQ_TOPICS)
+        manufacturer_id = rng.randint(1, len(MANUFACTURERS))
+        faqs.append((i, manufacturer_id, f"{topic} 관련 질문 {i}은 어떻게 하나요?",
+                     f"{topic} 관련 안내입니다. " * rng.randint(5, 40), i // 3 if i % 7 == 0 else None,
+                     '2025-09-04 00:00:00'))
+        topics.append((i, topic))
+        if rng.random() < 0.3:
+            model_id = (manufacturer_id - 1) * MODELS_PER_MANUFACTURER + rng.randint(1, MODELS_PER_MANUFACTURER)
+            mentions.append((i, model_id))
+    conn.executemany("""
+        INSERT INTO EV_Manufacturer_FAQ (id, manufacturer_id, question, answer, cluster_id, captured_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """, faqs)
+    conn.executemany("INSERT INTO EV_FAQ_Topic (faq_id, topic) VALUES (?, ?)", topics)
+    conn.executemany("INSERT INTO EV_FAQ_Model_Mention (faq_id, model_id) VALUES (?, ?)", mentions)
+
+    registrations, fires, ev_fires = [], [], []
+    for year in range(2015, 2025):
+        ev = 10000 * 2 ** (year - 2015)
+        registrations += [(year, 0, 'EV', ev), (year, 0, 'ICE', 23000000 + 100000 * (year - 2015))]
+        fires.append((year, 4000 + rng.randint(-300, 300), *(rng.randint(0, 1500) for _ in range(6))))
+        ev_fires.append((year, max(1, ev // 10000), rng.randint(0, 10), rng.randint(0, 2), rng.randint(0, 8),
+                         rng.randint(0, 10 ** 9)))
+    conn.executemany("INSERT INTO vehicle_registrations (year, month, fuel_type, count) VALUES (?, ?, ?, ?)",
+                     registrations)
+    conn.executemany("INSERT INTO total_fire_incidents VALUES (?, ?, ?, ?, ?, ?, ?, ?)", fires)
+    conn.executemany("INSERT INTO ev_fire_cases VALUES (?, ?, ?, ?, ?, ?)", ev_fires)
+    conn.commit()
+
+
+class StandInCursor:
+    """mysql.connector 커서처럼 %s 파라미터와 dictionary=True 를 지원하는 SQLite 커서."""
+
+    def __init__(self, database, cursor, dictionary):
+        self._database = database
+        self._cursor = cursor
+        self._dictionary = dictionary
+
+    def execute(self, sql, params=()):
+        if self._database.latency:
+            time.sleep(self._database.latency)  # 네트워크 왕복 흉내
+        self._cursor.execute(sql.replace('%s', '?'), tuple(params))
+
+    def _convert(self, row):
+        if row is None or not self._dictionary:
+            return row
+        return {description[0]: value for description, value in zip(self._cursor.description, row)}
+
+    def fetchall(self):
+        return [self._convert(row) for row in self._cursor.fetchall()]
+
+    def fetchone(self):
+        return self._convert(self._cursor.fetchone())
+
+    def close(self):
+        self._cursor.close()
+
+
+class StandInConnection:
+    def __init__(self, database):
+        self._database = database
+        self._conn = sqlite3.connect(database.path, check_same_thread=False)
+        self._closed = False
+
+    def is_connected(self):
+        return not self._closed
+
+    def cursor(self, dictionary=False):
+        return StandInCursor(self._database, self._conn.cursor(), dictionary)
+
+    def commit(self):
+        self._conn.commit()
+
+    def rollback(self):
+        self._conn.rollback()
+
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            self._conn.close()
+            self._database._released()
+
+
+# 공유 카운터 배열의 칸: 열린 연결 수, 동시 최대, 총 연결 수
+_OPEN, _PEAK, _TOTAL = range(3)
+
+
+def shared_counters(context=multiprocessing):
+    """프로세스 간에 공유하는 연결 카운터. 세션 프로세스마다 StandInDatabase(counters=...)로 넘깁니다."""
+    return context.Array('q', 3)
+
+
+class StandInDatabase:
+    """
+    부하 테스트용 로컬 DB. 임시 SQLite 파일에 가짜 등록/화재/FAQ 데이터를 채우고,
+    get_connection 을 대체해 동시에 열린 연결 수(peak)와 총 연결 수를 셉니다.
+    path 를 주면 이미 채워 둔 파일에 연결만 하고(삭제하지 않음), counters 를 주면
+    여러 프로세스가 같은 카운터를 써서 전체 동시 연결 수를 셉니다.
+    """
+
+    def __init__(self, faq_count=2000, latency_ms=0, seed=0, path=None, counters=None):
+        self.latency = latency_ms / 1000
+        self._counters = counters if counters is not None else shared_counters()
+        self._originals = None
+        self._owns_file = path is None
+        if path is not None:
+            self.path = path
+            return
+
+        fd, self.path = tempfile.mkstemp(prefix='ev_fire_loadtest_', suffix='.sqlite3')
+        os.close(fd)
+        conn = sqlite3.connect(self.path)
+        try:
+            _seed(conn, faq_count, random.Random(seed))
+        finally:
+            conn.close()
+
+    @property
+    def counters(self):
+        return self._counters
+
+    @property
+    def open_connections(self):
+        return self._counters[_OPEN]
+
+    @property
+    def peak_connections(self):
+        return self._counters[_PEAK]
+
+    @property
+    def total_connections(self):
+        return self._counters[_TOTAL]
+
+    def connect(self):
+        conn = StandInConnection(self)
+        with self._counters.get_lock():
+            self._counters[_OPEN] += 1
+            self._counters[_TOTAL] += 1
+            self._counters[_PEAK] = max(self._counters[_PEAK], self._counters[_OPEN])
+        return conn
+
+    def _released(self):
+        with self._counters.get_lock():
+            self._counters[_OPEN] -= 1
+
+    def install(self):
+        """db.connection 의 연결 함수를 이 DB로 바꿉니다. 페이지는 호출 시점에 db.get_connection 을 찾으므로 바로 적용됩니다."""
+        self._originals = (db_connection.get_connection, db_connection.get_pooled_connection)
+        db_connection.get_connection = self.connect
+        db_connection.get_pooled_connection = self.connect
+
+    def uninstall(self):
+        if self._originals:
+            db_connection.get_connection, db_connection.get_pooled_connection = self._originals
+            self._originals = None
+
+    def close(self):
+        self.uninstall()
+        if self._owns_file and os.path.exists(self.path):
+            os.remove(self.path)
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,44 +1,19 @@
 import streamlit as st
-from matplotlib import rc
 import pandas as pd
-from bokeh.plotting import figure
-import sys # Add sys import
-import os # Add os import
-import altair as alt # Add altair import for advanced charting
 
-# Add the parent directory to the Python path to enable importing connection.py
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'db')))
-
-from connection import get_connection # DB 연결
-import mysql.connector # 에러 핸들링용
+from db import connection as db # DB 연결 (mysql.connector는 첫 연결 시 임포트)
+from analytics import fire_data # 통계 페이지와 API가 함께 쓰는 조회 함수
+from analytics.fire_rates import calculate_fire_rates_per_registration, compute_damage_rates, compute_rates, fire_events_long # 발생률/신뢰구간 계산
 
 # --- DB에서 데이터 로드 함수 ---
 def load_registration_data():
     conn = None
     try:
-        conn = get_connection()
+        conn = db.get_connection()
         if conn:
-            cursor = conn.cursor(dictionary=True)
-            # vehicle_registrations 테이블에서 데이터 가져오기
-            cursor.execute("SELECT year, fuel_type, count FROM vehicle_registrations")
-            df = pd.DataFrame(cursor.fetchall())
-            
-            # ICE와 EV로 분류
-            
-            # ICE 등록대수
-            ice_reg = df[df['fuel_type'] == 'ICE'].copy()
-            ice_reg.rename(columns={'year': '연도', 'count': '등록대수'}, inplace=True)
-            ice_reg['연료'] = 'ICE'
-            
-            # EV 등록대수
-            ev_reg = df[df['fuel_type'] == 'EV'].copy()
-            ev_reg.rename(columns={'year': '연도', 'count': '등록대수'}, inplace=True)
-            ev_reg['연료'] = 'EV'
-            
-            # 두 데이터프레임 합치기
-            reg_df = pd.concat([ice_reg, ev_reg], ignore_index=True)
-            return reg_df
-    except mysql.connector.Error as err:
+            # vehicle_registrations 테이블에서 전국 연간(또는 12월 말 기준) ICE/EV 등록대수 가져오기
+            return fire_data.load_registrations(conn.cursor(dictionary=True))
+    except db.Error as err:
         st.error(f"등록 데이터 로드 중 오류 발생: {err}")
         return pd.DataFrame()
     finally:
@@ -48,48 +23,35 @@ def load_registration_data():
 def load_fire_incident_data():
     conn = None
     try:
-        conn = get_connection()
+        conn = db.get_connection()
         if conn:
-            cursor = conn.cursor(dictionary=True)
-            
-            # total_fire_incidents (ICE 포함 전체)
-            cursor.execute("SELECT year, total_fires FROM total_fire_incidents")
-            total_fire_df = pd.DataFrame(cursor.fetchall())
-            total_fire_df.rename(columns={'year': '연도', 'total_fires': '화재 발생 수'}, inplace=True) # Rename 'year' to '연도'
-            total_fire_df['연료'] = 'ICE' # 임시로 ICE로 간주 (전체 차량 화재)
-
-            # ev_fire_cases (EV 화재)
-            cursor.execute("SELECT year, total_fires FROM ev_fire_cases")
-            ev_fire_df = pd.DataFrame(cursor.fetchall())
-            ev_fire_df.rename(columns={'year': '연도', 'total_fires': '화재 발생 수'}, inplace=True) # Rename 'year' to '연도'
-            ev_fire_df['연료'] = 'EV'
-            
-            # 두 데이터프레임 합치기
-            fire_df = pd.concat([total_fire_df, ev_fire_df], ignore_index=True)
-            return fire_df
-    except mysql.connector.Error as err:
+            # total_fire_incidents (ICE로 간주) + ev_fire_cases (EV)
+            return fire_data.load_fire_counts(conn.cursor(dictionary=True))
+    except db.Error as err:
         st.error(f"화재 발생 데이터 로드 중 오류 발생: {err}")
         return pd.DataFrame()
     finally:
         if conn:
             conn.close()
 
-def calculate_fire_rates_per_registration(reg_df, fire_df):
-    if reg_df.empty or fire_df.empty:
-        return pd.DataFrame()
-    
-    # 등록대수와 화재 발생 수를 병합
-    merged_df = pd.merge(reg_df, fire_df, on=['연도', '연료'], how='inner')
-    
-    # 화재율 계산 (비율)
-    merged_df['화재율'] = (merged_df['화재 발생 수'] / merged_df['등록대수']) * 100000 # Calculate per 100,000 registrations
-    
-    return merged_df[['연도', '연료', '화재율']]
+def load_fire_breakdown_data():
+    """발생 장소별 전체 화재와 EV 인명/재산피해 컬럼을 모두 가져옵니다."""
+    conn = None
+    try:
+        conn = db.get_connection()
+        if conn:
+            return fire_data.load_fire_breakdown(conn.cursor(dictionary=True))
+    except db.Error as err:
+        st.error(f"화재 세부 데이터 로드 중 오류 발생: {err}")
+    finally:
+        if conn:
+            conn.close()
+    return pd.DataFrame(), pd.DataFrame()
 
 def load_faq_data_from_db():
     conn = None
     try:
-        conn = get_connection()
+        conn = db.get_connection()
         if conn:
             cursor = conn.cursor(dictionary=True)
             # EV_Manufacturer_FAQ 테이블에서 FAQ 데이터 가져오기
@@ -105,7 +67,7 @@ def load_faq_data_from_db():
             """)
             faqs_df = pd.DataFrame(cursor.fetchall())
             return faqs_df
-    except mysql.connector.Error as err:
+    except db.Error as err:
         st.error(f"FAQ 데이터 로드 중 오류 발생: {err}")
         return pd.DataFrame()
     finally:
@@ -157,20 +119,48 @@ if not reg_data.empty and not reg.empty:
     with col1:
         st.subheader("📊 등록대수 10만 건당 화재 발생 횟수")
     fire_rates_df = calculate_fire_rates_per_registration(reg, reg_data)
+    total_fire_df, ev_fire_df = load_fire_breakdown_data()
+    rate_df = compute_rates(fire_events_long(total_fire_df, ev_fire_df), reg)
     if not fire_rates_df.empty:
-        chart = alt.Chart(fire_rates_df).mark_bar().encode(
+        import altair as alt # 차트를 그릴 때만 임포트
+
+        bars = alt.Chart(fire_rates_df).mark_bar().encode(
             x=alt.X('연도:O', axis=alt.Axis(title='연도')),
             y=alt.Y('화재율:Q', axis=alt.Axis(title='10만 건당 화재 발생 횟수')),
             color='연료:N',
             xOffset='연료:N', # This creates grouped bars
             tooltip=['연도', '연료', '화재율']
-        ).properties(
-            title='등록대수 10만 건당 화재 발생 횟수'
+        )
+        # 전체 화재 건수 기준 95% 정확 Poisson 신뢰구간
+        ci_df = rate_df[rate_df['항목'].isin(['전체', '화재'])]
+        error_bars = alt.Chart(ci_df).mark_rule(color='black').encode(
+            x='연도:O',
+            xOffset='연료:N',
+            y='신뢰구간 하한:Q',
+            y2='신뢰구간 상한:Q',
+            tooltip=['연도', '연료', '건수', '신뢰구간 하한', '신뢰구간 상한']
+        )
+        chart = (bars + error_bars).properties(
+            title='등록대수 10만 건당 화재 발생 횟수 (95% 신뢰구간)'
         ).configure_axis(
             labelAngle=0
         ).interactive()
         st.altair_chart(chart, use_container_width=True)
     else:
         st.warning("화재율 데이터를 계산할 수 없습니다.")
+
+    # 3. 발생 장소 / 인명피해별 발생률
+    if not rate_df.empty:
+        st.subheader("📐 발생 장소·인명피해별 10만 대당 발생률 (95% 신뢰구간)")
+        st.caption("신뢰구간은 정확한 Poisson 구간이며, 부트스트랩 구간은 건수를 Poisson 재표본추출해 계산했습니다. "
+                   "EV 표본이 작아 구간이 넓게 나타날 수 있습니다. "
+                   "0건인 항목(예: EV 사망)은 재표본이 항상 0이라 부트스트랩 구간을 비워 두었으니 "
+                   "정확한 신뢰구간 상한을 참고하세요.")
+        st.dataframe(rate_df.round(3), use_container_width=True, hide_index=True)
+
+        damage_df = compute_damage_rates(ev_fire_df, reg)
+        if not damage_df.empty:
+            st.subheader("💸 EV 화재 10만 대당 재산피해액(원)")
+            st.dataframe(damage_df.round(0), use_container_width=True, hide_index=True)
 else:
     st.warning("화재 현황 데이터를 불러오지 못했습니다. DB 연결 및 테이블을 확인해주세요.")
\ No newline at end of file
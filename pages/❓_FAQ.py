@@ -1,7 +1,8 @@
 import streamlit as st
-import pandas as pd
-from connection import get_connection # DB 연결
-import mysql.connector # 에러 핸들링용
+
+from db import connection as db # DB 연결 (mysql.connector는 첫 연결 시 임포트)
+from search.autocomplete import build_faq_autocomplete # 검색어 자동완성 (자모 단위 접두사 트라이)
+from search.facets import FacetIndex # 제조사/주제/모델 패싯 비트맵 필터
 
 st.set_page_config(page_title="EV FAQ 상세", layout="wide")
 st.title("❓ EV FAQ 상세 조회")
@@ -10,29 +11,83 @@ st.caption("데이터베이스에서 FAQ 데이터를 불러와 검색 및 조
 # --- DB에서 FAQ 데이터 로드 함수 ---
 @st.cache_data(ttl=3600) # 1시간 캐시
 def load_all_faqs_from_db():
+    import pandas as pd # 첫 로드 시 임포트 (이후에는 캐시된 DataFrame 사용)
+
     conn = None
     try:
-        conn = get_connection()
+        conn = db.get_connection()
         if conn:
             cursor = conn.cursor(dictionary=True)
             cursor.execute("""
                 SELECT 
+                    faq.id,
                     m.name as manufacturer_name, 
                     faq.question, 
-                    faq.answer
+                    faq.answer,
+                    faq.cluster_id
                 FROM EV_Manufacturer_FAQ faq
                 JOIN EV_Manufacturer m ON faq.manufacturer_id = m.id
                 ORDER BY m.name, faq.question
             """)
             faqs_df = pd.DataFrame(cursor.fetchall())
+
+            # 적재 시 태깅된 주제/언급 모델을 FAQ별 목록으로 붙이기
+            cursor.execute("SELECT faq_id, topic FROM EV_FAQ_Topic")
+            topics = {}
+            for row in cursor.fetchall():
+                topics.setdefault(row['faq_id'], []).append(row['topic'])
+            cursor.execute("""
+                SELECT mm.faq_id, mo.name
+                FROM EV_FAQ_Model_Mention mm
+                JOIN EV_Model mo ON mm.model_id = mo.id
+            """)
+            models = {}
+            for row in cursor.fetchall():
+                models.setdefault(row['faq_id'], []).append(row['name'])
+            if not faqs_df.empty:
+                faqs_df['topics'] = [topics.get(faq_id, []) for faq_id in faqs_df['id']]
+                faqs_df['models'] = [models.get(faq_id, []) for faq_id in faqs_df['id']]
+            # 인덱스 캐시 키: DataFrame 전체를 해시하지 않고 로드 시각으로 같은 데이터인지 구분합니다.
+            faqs_df.attrs['loaded_at'] = pd.Timestamp.now().isoformat()
             return faqs_df
-    except mysql.connector.Error as err:
+    except db.Error as err:
         st.error(f"FAQ 데이터 로드 중 오류 발생: {err}")
         return pd.DataFrame()
     finally:
         if conn:
             conn.close()
 
+@st.cache_resource(ttl=3600)
+def load_autocomplete_index(_faqs_df, loaded_at):
+    """
+    FAQ 질문으로 자동완성 인덱스를 만듭니다. 유사 중복이 많은 질문일수록 먼저 추천합니다.
+    _faqs_df 는 해시하지 않고(키 입력마다 전체 해시 방지) loaded_at 으로만 캐시를 구분합니다.
+    """
+    popularity = _faqs_df.groupby('cluster_id', dropna=False)['question'].transform('size')
+    popularity = popularity.where(_faqs_df['cluster_id'].notna(), 1)
+    return build_faq_autocomplete(_faqs_df['question'].tolist(), popularity.tolist())
+
+# 패싯 키 → 화면 표시 이름
+FACETS = {'manufacturer': "제조사", 'topic': "주제", 'model': "언급 모델"}
+
+# 패싯 아래에 개수를 보여 줄 값의 최대 개수
+FACET_COUNT_PREVIEW = 6
+
+@st.cache_resource(ttl=3600)
+def load_facet_index(_faqs_df, loaded_at):
+    """
+    행 번호 기준 패싯 비트맵을 만듭니다. 필터 조합은 비트 AND, 개수는 popcount로 계산됩니다.
+    목록 컬럼이 있는 _faqs_df 는 해시하지 않고 loaded_at 으로만 캐시를 구분합니다.
+    """
+    index = FacetIndex(len(_faqs_df))
+    index.add_values('manufacturer', _faqs_df['manufacturer_name'].tolist())
+    index.add_values('topic', _faqs_df['topics'].tolist())
+    index.add_values('model', _faqs_df['models'].tolist())
+    return index
+
+def use_suggestion(suggestion):
+    st.session_state['faq_search'] = suggestion
+
 # 데이터 로드
 data_df = load_all_faqs_from_db()
 
@@ -43,24 +98,51 @@ if data_df.empty:
 st.success(f"총 {len(data_df)}개 항목 로드 완료")
 
 # 검색 필터
-search_query = st.text_input("질문/답변에서 검색:", "")
+search_query = st.text_input("질문/답변에서 검색:", "", key='faq_search')
+
+# 입력 중인 검색어로 시작하는 단어/질문 추천 (입력 중인 음절도 매칭)
+if search_query:
+    autocomplete_index = load_autocomplete_index(data_df, data_df.attrs.get('loaded_at'))
+    # 단어 추천과 질문 추천의 문구가 같을 수 있으므로 순서를 유지한 채 중복 제거 (버튼 key 중복 방지)
+    suggestions = list(dict.fromkeys(text for _, text in autocomplete_index.suggest(search_query, 6)
+                                     if text != search_query))
+    if suggestions:
+        for col, suggestion in zip(st.columns(len(suggestions)), suggestions):
+            col.button(suggestion, key=f"suggest_{suggestion}", on_click=use_suggestion, args=(suggestion,))
+
+# 유사 중복 FAQ 묶기 (로드 시 계산된 cluster_id 기준으로 대표 항목만 표시)
+collapse_duplicates = st.checkbox("유사 중복 FAQ 묶어서 보기", value=True)
+
+# 중복 묶기/검색 조건을 만족하는 행 (패싯 필터와 개수의 기준)
+base_mask = data_df['question'].notna()
+if collapse_duplicates and 'cluster_id' in data_df.columns:
+    base_mask &= data_df['cluster_id'].isna() | ~data_df.duplicated(subset='cluster_id')
 
-filtered_df = data_df
 if search_query:
     search_query_lower = search_query.lower()
-    filtered_df = data_df[
-        data_df['question'].str.lower().str.contains(search_query_lower) |
-        data_df['answer'].str.lower().str.contains(search_query_lower)
-    ]
+    base_mask &= (
+        data_df['question'].str.lower().str.contains(search_query_lower, regex=False) |
+        data_df['answer'].str.lower().str.contains(search_query_lower, regex=False)
+    )
 
-st.write(f"표시할 항목: {len(filtered_df)}개")
+# 패싯 필터 (같은 패싯 안에서는 OR, 패싯끼리는 AND).
+# 위젯 ID 는 선택지 문구로 만들어지므로 선택지에 개수를 넣으면 다른 패싯을 바꿀 때마다 선택이 초기화됩니다.
+# 그래서 선택지는 값만 고정해 두고, 그 값을 고르면 나올 개수는 위젯 아래 캡션으로 보여 줍니다.
+facet_index = load_facet_index(data_df, data_df.attrs.get('loaded_at'))
+base = FacetIndex.from_mask(base_mask)
+selected = {facet: st.session_state.get(f"facet_{facet}", []) for facet in FACETS}
+facet_counts = facet_index.counts(selected, base)
 
-# 제조사별 필터 (선택 사항)
-manufacturers = ['전체'] + list(data_df['manufacturer_name'].unique())
-selected_manufacturer = st.selectbox("제조사별 필터:", manufacturers)
+for col, (facet, label) in zip(st.columns(len(FACETS)), FACETS.items()):
+    counts = facet_counts.get(facet, {})
+    col.multiselect(f"{label}별 필터:", facet_index.options(facet), key=f"facet_{facet}")
+    preview = [f"{value} {count}" for value, count in counts.items() if count][:FACET_COUNT_PREVIEW]
+    if preview:
+        col.caption(" · ".join(preview))
 
-if selected_manufacturer != '전체':
-    filtered_df = filtered_df[filtered_df['manufacturer_name'] == selected_manufacturer]
+filtered_df = data_df.iloc[FacetIndex.rows(facet_index.filter(selected, base))]
+
+st.write(f"표시할 항목: {len(filtered_df)}개")
 
 # FAQ 표시
 if not filtered_df.empty:
@@ -0,0 +1,126 @@
+import re
+import unicodedata
+
+# --- 설정 ---
+# 노드마다 미리 계산해 두는 추천 개수
+TOP_K = 10
+# 이보다 짧은 단어는 추천하지 않습니다.
+MIN_TERM_LENGTH = 2
+# 단어 끝에서 떼어 내는 조사 (긴 것부터 검사). "충전은" → "충전"
+JOSA = ('에서', '으로', '은', '는', '이', '가', '을', '를', '에', '의', '로', '도', '와', '과')
+
+# --- 한글 자모 분해 ---
+# 입력 중인 음절("배ㅌ", "밭")도 완성된 단어("배터리", "바터")의 접두사가 되도록
+# 초성/중성/종성을 호환 자모로 풀고, 겹받침/이중모음도 낱자로 나눕니다.
+_CHO = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+_JUNG = ['ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅗㅏ', 'ㅗㅐ', 'ㅗㅣ', 'ㅛ', 'ㅜ',
+         'ㅜㅓ', 'ㅜㅔ', 'ㅜㅣ', 'ㅠ', 'ㅡ', 'ㅡㅣ', 'ㅣ']
+_JONG = ['', 'ㄱ', 'ㄲ', 'ㄱㅅ', 'ㄴ', 'ㄴㅈ', 'ㄴㅎ', 'ㄷ', 'ㄹ', 'ㄹㄱ', 'ㄹㅁ', 'ㄹㅂ', 'ㄹㅅ', 'ㄹㅌ',
+         'ㄹㅍ', 'ㄹㅎ', 'ㅁ', 'ㅂ', 'ㅂㅅ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+_COMPOUND_JAMO = {
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ', 'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ',
+    'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ', 'ㅄ': 'ㅂㅅ',
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ', 'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+}
+_TERM = re.compile(r'[0-9a-z가-힣]+')
+
+
+def to_jamo(text):
+    """공백을 정리하고 소문자로 바꾼 뒤 한글 음절을 자모열로 풉니다. (다른 문자는 그대로)"""
+    parts = []
+    for ch in ' '.join(unicodedata.normalize('NFC', text).lower().split()):
+        code = ord(ch) - 0xAC00
+        if 0 <= code < 11172:
+            parts.append(_CHO[code // 588] + _JUNG[code % 588 // 28] + _JONG[code % 28])
+        else:
+            parts.append(_COMPOUND_JAMO.get(ch, ch))
+    return ''.join(parts)
+
+
+def question_terms(question):
+    """질문에서 추천할 단어들 (조사 제거, 중복 제거, 등장 순서 유지)."""
+    terms = []
+    for term in _TERM.findall(unicodedata.normalize('NFC', question).lower()):
+        for josa in JOSA:
+            if term.endswith(josa) and len(term) - len(josa) >= MIN_TERM_LENGTH:
+                term = term[:-len(josa)]
+                break
+        if len(term) >= MIN_TERM_LENGTH and term not in terms:
+            terms.append(term)
+    return terms
+
+
+# --- 접두사 트라이 ---
+class _Node:
+    __slots__ = ('children', 'entries', 'top')
+
+    def __init__(self):
+        self.children = {}
+        self.entries = {}  # 이 노드에서 끝나는 키의 {(종류, 추천 문구): 점수}
+        self.top = ()
+
+
+class AutocompleteIndex:
+    """
+    자모 단위 접두사 트라이. build() 때 각 노드에 하위 전체의 상위 k개 추천을 미리 계산해 두므로
+    suggest() 는 접두사 길이만큼 노드를 따라간 뒤 저장된 목록을 돌려주기만 합니다.
+    """
+
+    def __init__(self, k=TOP_K):
+        self.k = k
+        self.root = _Node()
+
+    def add(self, key, suggestion, kind='term', score=1):
+        """key 로 시작하는 입력에 suggestion 을 추천합니다. 같은 (종류, 문구)를 다시 넣으면 점수를 더합니다."""
+        node = self.root
+        for ch in to_jamo(key):
+            node = node.children.setdefault(ch, _Node())
+        entry = (kind, suggestion)
+        node.entries[entry] = node.entries.get(entry, 0) + score
+
+    def build(self):
+        """하위 노드부터 (점수 내림차순, 짧은 문구, 가나다순) 상위 k개를 합쳐 올립니다."""
+        order, stack = [], [self.root]
+        while stack:
+            node = stack.pop()
+            order.append(node)
+            stack.extend(node.children.values())
+
+        for node in reversed(order):
+            candidates = dict(node.entries)
+            for child in node.children.values():
+                for score, entry in child.top:
+                    if candidates.get(entry, 0) < score:
+                        candidates[entry] = score
+            ranked = sorted(candidates.items(), key=lambda item: (-item[1], len(item[0][1]), item[0][1]))
+            node.top = tuple((score, entry) for entry, score in ranked[:self.k])
+        return self
+
+    def suggest(self, prefix, limit=None):
+        """prefix(입력 중인 음절 포함)로 시작하는 추천을 [(종류, 문구)] 로 반환합니다."""
+        node = self.root
+        for ch in to_jamo(prefix):
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        return [entry for _, entry in node.top[:limit or self.k]]
+
+
+def build_faq_autocomplete(questions, popularity=None, k=TOP_K):
+    """
+    FAQ 질문으로 추천 인덱스를 만듭니다.
+    - 단어('term'): 질문 속 단어. 점수는 그 단어가 나오는 FAQ 수
+    - 질문('question'): 질문 전체. 질문 첫머리와 질문 속 각 단어로 찾을 수 있고,
+      점수는 popularity (기본 1) 이며 같은 질문이 여러 번 나오면 더해집니다.
+    popularity 는 질문과 같은 길이의 점수 목록입니다. (예: 유사 중복 클러스터 크기)
+    """
+    index = AutocompleteIndex(k)
+    for i, question in enumerate(questions):
+        if not question:
+            continue
+        score = popularity[i] if popularity is not None else 1
+        index.add(question, question, 'question', score)
+        for term in question_terms(question):
+            index.add(term, term, 'term')
+            index.add(term, question, 'question', score)
+    return index.build()
@@ -0,0 +1,71 @@
+# 파이썬 정수를 비트셋으로 써서 행 i 가 값에 속하면 i 번째 비트를 켭니다.
+# 필터 조합은 비트 AND/OR, 개수는 int.bit_count() 한 번이라 행/패싯 수가 늘어도 재스캔이 없습니다.
+
+
+class FacetIndex:
+    """
+    행 번호(0 ~ size-1) 기반 패싯 비트맵 인덱스.
+    같은 패싯 안에서 고른 값들은 OR, 서로 다른 패싯끼리는 AND 로 묶습니다.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.all_rows = (1 << size) - 1
+        self.bitmaps = {}  # {패싯: {값: 비트맵}}
+
+    def add(self, facet, value, row):
+        values = self.bitmaps.setdefault(facet, {})
+        values[value] = values.get(value, 0) | (1 << row)
+
+    def add_values(self, facet, values):
+        """values[i] 가 행 i 의 값(또는 값 목록)인 열 하나를 통째로 추가합니다. None 은 건너뜁니다."""
+        bitmaps = self.bitmaps.setdefault(facet, {})
+        for row, row_values in enumerate(values):
+            if row_values is None:
+                continue
+            if isinstance(row_values, str) or not hasattr(row_values, '__iter__'):
+                row_values = [row_values]
+            for value in row_values:
+                bitmaps[value] = bitmaps.get(value, 0) | (1 << row)
+        return self
+
+    @staticmethod
+    def from_mask(mask):
+        """True/False 목록을 비트맵으로 바꿉니다. (검색어 등 패싯 밖 조건을 합칠 때)"""
+        return int(''.join('1' if flag else '0' for flag in reversed(list(mask))) or '0', 2)
+
+    def options(self, facet):
+        """패싯의 모든 값을 가나다순으로 반환합니다. 개수와 무관해 선택이 바뀌어도 목록이 그대로입니다."""
+        return sorted(self.bitmaps.get(facet, {}), key=str)
+
+    def _facet_bitmap(self, facet, values):
+        bitmaps = self.bitmaps.get(facet, {})
+        bitmap = 0
+        for value in values:
+            bitmap |= bitmaps.get(value, 0)
+        return bitmap
+
+    def filter(self, selected, base=None):
+        """selected = {패싯: [값, ...]} (빈 목록은 전체) 를 만족하는 행의 비트맵."""
+        bitmap = self.all_rows if base is None else base
+        for facet, values in selected.items():
+            if values:
+                bitmap &= self._facet_bitmap(facet, values)
+        return bitmap
+
+    def counts(self, selected, base=None):
+        """
+        패싯별 {값: 개수}. 각 패싯의 개수는 '그 패싯을 뺀 나머지 선택'을 적용한 결과 기준이라
+        이미 고른 패싯 안에서도 다른 값을 더 골랐을 때의 개수를 보여 줍니다.
+        """
+        result = {}
+        for facet, bitmaps in self.bitmaps.items():
+            others = self.filter({f: v for f, v in selected.items() if f != facet}, base)
+            counts = {value: (bitmap & others).bit_count() for value, bitmap in bitmaps.items()}
+            result[facet] = dict(sorted(counts.items(), key=lambda item: (-item[1], str(item[0]))))
+        return result
+
+    @staticmethod
+    def rows(bitmap):
+        """비트맵에 켜진 행 번호를 오름차순으로 반환합니다."""
+        return [row for row, bit in enumerate(bin(bitmap)[:1:-1]) if bit == '1']
@@ -0,0 +1,14 @@
+import sys
+
+import pytest
+
+
+@pytest.fixture
+def restore_main_module():
+    """
+    AppTest 는 페이지 스크립트를 실행하면서 sys.modules['__main__'] 을 그 페이지로 바꿔 둡니다.
+    그대로 두면 뒤이은 spawn 프로세스(부하 테스트)가 페이지를 다시 실행하므로 테스트가 끝나면 되돌립니다.
+    """
+    main_module = sys.modules['__main__']
+    yield
+    sys.modules['__main__'] = main_module
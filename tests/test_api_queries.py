@@ -0,0 +1,57 @@
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path to enable importing the api package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api.queries import (DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, decode_cursor, encode_cursor, fetch_faq_page, make_etag,
+                         parse_page_args)
+
+
+class FakeCursor:
+    def __init__(self, rows):
+        self.rows = rows
+
+    def execute(self, sql, params=()):
+        self.sql, self.params = sql, params
+
+    def fetchall(self):
+        after_id, limit = self.params[0], self.params[-1]
+        return [row for row in self.rows if row['id'] > after_id][:limit]
+
+
+def test_cursor_round_trip_and_rejects_garbage():
+    assert decode_cursor(encode_cursor(1234)) == 1234
+    assert decode_cursor(None) == 0
+    with pytest.raises(ValueError):
+        decode_cursor('not-a-cursor')
+
+
+def test_etag_depends_on_version_and_query():
+    etag = make_etag('101-202', '/api/faqs?q=충전')
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag('101-202', '/api/faqs?q=충전')
+    assert etag != make_etag('101-203', '/api/faqs?q=충전')
+    assert etag != make_etag('101-202', '/api/faqs?q=배터리')
+
+
+def test_fetch_faq_page_walks_keyset_pages():
+    cursor = FakeCursor([{'id': i, 'question': f"질문 {i}"} for i in range(1, 6)])
+    seen, token = [], None
+    while True:
+        items, token = fetch_faq_page(cursor, decode_cursor(token), limit=2, query='100%')
+        seen += [item['id'] for item in items]
+        if token is None:
+            break
+    assert seen == [1, 2, 3, 4, 5]
+    assert cursor.params[1:3] == ['%100\\%%', '%100\\%%']
+
+
+def test_parse_page_args_clamps_limit_and_reports_bad_values():
+    assert parse_page_args(None, None) == (0, DEFAULT_PAGE_SIZE)
+    assert parse_page_args(encode_cursor(7), '10000') == (7, MAX_PAGE_SIZE)
+    assert parse_page_args(None, '0') == (0, 1)
+    with pytest.raises(ValueError, match="limit 은 정수여야 합니다"):
+        parse_page_args(None, 'abc')
@@ -0,0 +1,70 @@
+import sys
+import os
+import gzip
+import json
+from unittest import mock
+
+import pytest
+
+tornado = pytest.importorskip('tornado')
+from tornado.testing import AsyncHTTPTestCase
+
+# Add the project root to the Python path to enable importing the api package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from api import queries, server
+from loadtest.stand_in_db import StandInDatabase
+
+
+class ApiServerTest(AsyncHTTPTestCase):
+    """가짜 DB(SQLite) 위에서 핸들러의 ETag/gzip/오류 응답을 확인합니다. 데이터 버전은 고정값으로 바꿉니다."""
+
+    def setUp(self):
+        self.database = StandInDatabase(faq_count=30)
+        self.database.install()
+        self.version = '101-202'
+        self.version_patch = mock.patch.object(queries, 'data_version', lambda cursor, tables: self.version)
+        self.version_patch.start()
+        server._versions.clear()
+        server._responses.clear()
+        super().setUp()
+
+    def tearDown(self):
+        super().tearDown()
+        self.version_patch.stop()
+        self.database.close()
+
+    def get_app(self):
+        return server.make_app()
+
+    def test_if_none_match_returns_304(self):
+        first = self.fetch('/api/faqs?limit=5')
+        self.assertEqual(first.code, 200)
+        body = json.loads(first.body)
+        self.assertEqual((len(body['items']), body['version']), (5, '101-202'))
+
+        etag = first.headers['Etag']
+        self.assertEqual(self.fetch('/api/faqs?limit=5', headers={'If-None-Match': etag}).code, 304)
+
+        self.version = '101-203'
+        server._versions.clear()  # TTL 이 지난 것처럼
+        changed = self.fetch('/api/faqs?limit=5', headers={'If-None-Match': etag})
+        self.assertEqual(changed.code, 200)
+        self.assertNotEqual(changed.headers['Etag'], etag)
+
+    def test_gzip_response_and_vary_header(self):
+        response = self.fetch('/api/faqs?limit=50', headers={'Accept-Encoding': 'gzip'}, decompress_response=False)
+        self.assertEqual(response.code, 200)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        self.assertEqual(len(json.loads(gzip.decompress(response.body))['items']), 30)
+
+    def test_bad_limit_is_400_with_korean_body_and_ascii_reason(self):
+        response = self.fetch('/api/faqs?limit=abc')
+        self.assertEqual(response.code, 400)
+        self.assertEqual(response.reason, 'Bad Request')
+        self.assertEqual(json.loads(response.body), {'error': "limit 은 정수여야 합니다: abc"})
+
+        response = self.fetch('/api/faqs?cursor=%25%25')
+        self.assertEqual((response.code, response.reason), (400, 'Bad Request'))
+        self.assertTrue(json.loads(response.body)['error'].startswith("잘못된 cursor 입니다"))
@@ -0,0 +1,60 @@
+import sys
+import os
+import sqlite3
+
+import pytest
+
+# Add the project root to the Python path to enable importing the search package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from search.autocomplete import build_faq_autocomplete, question_terms, to_jamo
+
+
+QUESTIONS = [
+    "충전은 얼마나 걸리나요?",
+    "충전기 설치는 어떻게 하나요?",
+    "배터리 보증 기간은?",
+    "배터리 화재 시 대처 방법",
+    "충전 중 화재가 나면?",
+]
+
+
+def test_to_jamo_makes_partial_syllables_prefixes():
+    assert to_jamo("밭") == "ㅂㅏㅌ" and to_jamo("바터").startswith(to_jamo("밭"))
+    assert to_jamo("과") == "ㄱㅗㅏ" and to_jamo("ㄳ") == "ㄱㅅ"
+    assert to_jamo("  EV  충전 ") == "ev ㅊㅜㅇㅈㅓㄴ"
+
+
+def test_question_terms_strip_josa():
+    assert question_terms("충전은 얼마나 걸리나요?") == ["충전", "얼마나", "걸리나요"]
+
+
+def test_suggest_matches_partial_syllables_and_ranks_by_frequency():
+    index = build_faq_autocomplete(QUESTIONS, popularity=[3, 1, 1, 1, 1])
+    for prefix in ("충", "추", "충ㅈ", "충저"):
+        assert index.suggest(prefix, 3) == [
+            ('question', "충전은 얼마나 걸리나요?"), ('term', "충전"), ('term', "충전기")]
+    assert ('question', "충전 중 화재가 나면?") in index.suggest("화재")
+    assert index.suggest("배ㅌ", 1) == [('term', "배터리")]
+    assert index.suggest("수소") == []
+
+
+def test_faq_page_renders_suggestion_shared_by_term_and_question(restore_main_module):
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+    from loadtest.run import PAGES
+    from loadtest.stand_in_db import StandInDatabase
+
+    with StandInDatabase(faq_count=20) as database:
+        # 한 단어짜리 질문은 단어 추천과 질문 추천의 문구가 같습니다.
+        conn = sqlite3.connect(database.path)
+        conn.execute("INSERT INTO EV_Manufacturer_FAQ (manufacturer_id, question, answer) "
+                     "VALUES (1, '충전요금', '요금은 충전기마다 다릅니다.')")
+        conn.commit()
+        conn.close()
+
+        at = AppTest.from_file(PAGES['faq'], default_timeout=60).run()
+        at.text_input(key='faq_search').input('충전').run()
+        assert not at.exception
+        labels = [button.label for button in at.button]
+        assert labels.count('충전요금') == 1
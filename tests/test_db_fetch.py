@@ -2,10 +2,10 @@ import sys
 import os
 import pandas as pd
 
-# Add the parent directory to the Python path to enable importing connection.py
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), 'db')))
+# Add the project root to the Python path to enable importing the db/analytics packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from connection import get_connection
+from db.connection import get_connection
 
 def test_fetch():
     conn = None
@@ -0,0 +1,66 @@
+import sys
+import os
+
+import pytest
+
+# Add the project root to the Python path to enable importing the search/db packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from db.sql.faq_topics import build_topic_matcher, classify_topics
+from search.facets import FacetIndex
+
+
+def _index():
+    index = FacetIndex(5)
+    index.add_values('manufacturer', ['기아', '기아', '쉐보레', '테슬라', '기아'])
+    index.add_values('topic', [['충전'], ['배터리', '화재/안전'], ['충전', '보증'], [], ['배터리']])
+    index.add_values('model', [['EV6'], None, ['볼트 EV'], ['모델 Y'], ['EV6', 'EV9']])
+    return index
+
+
+def test_filter_ors_within_facet_and_ands_across_facets():
+    index = _index()
+    assert FacetIndex.rows(index.filter({'manufacturer': ['기아'], 'topic': []})) == [0, 1, 4]
+    assert FacetIndex.rows(index.filter({'manufacturer': ['기아'], 'topic': ['충전', '배터리']})) == [0, 1, 4]
+    assert FacetIndex.rows(index.filter({'manufacturer': ['기아'], 'model': ['EV6']})) == [0, 4]
+    base = FacetIndex.from_mask([True, True, False, True, False])
+    assert FacetIndex.rows(index.filter({'topic': ['충전']}, base)) == [0]
+
+
+def test_counts_exclude_own_facet_selection():
+    counts = _index().counts({'manufacturer': ['기아'], 'topic': ['배터리']})
+    assert counts['manufacturer'] == {'기아': 2, '쉐보레': 0, '테슬라': 0}
+    assert counts['topic'] == {'배터리': 2, '충전': 1, '화재/안전': 1, '보증': 0}
+    assert counts['model'] == {'EV6': 1, 'EV9': 1, '모델 Y': 0, '볼트 EV': 0}
+
+
+def test_options_do_not_depend_on_selection():
+    index = _index()
+    assert index.options('manufacturer') == ['기아', '쉐보레', '테슬라']
+    assert index.options('topic') == sorted(index.counts({'manufacturer': ['쉐보레']})['topic'])
+    assert index.options('없는 패싯') == []
+
+
+def test_faq_page_keeps_selection_when_other_facet_changes(restore_main_module):
+    pytest.importorskip('streamlit')
+    from streamlit.testing.v1 import AppTest
+    from loadtest.run import PAGES
+    from loadtest.stand_in_db import StandInDatabase
+
+    with StandInDatabase(faq_count=200):
+        at = AppTest.from_file(PAGES['faq'], default_timeout=60).run()
+        at.multiselect(key='facet_manufacturer').select('기아').run()
+        at.multiselect(key='facet_topic').select('충전').run()
+        assert at.multiselect(key='facet_manufacturer').value == ['기아']
+        assert at.multiselect(key='facet_topic').value == ['충전']
+        assert not at.exception
+
+
+def test_classify_topics_from_keywords():
+    matcher = build_topic_matcher()
+    assert classify_topics(matcher, [
+        "급속 충전 시 배터리 온도가 올라가나요?",
+        "고전압 배터리 보증 기간은 얼마인가요?",
+        "주행 중 연기가 나면 어떻게 하나요?",
+        "내비게이션 업데이트 방법",
+    ]) == [{'충전', '배터리'}, {'배터리', '보증'}, {'화재/안전'}, set()]
@@ -0,0 +1,48 @@
+import sys
+import os
+
+import numpy as np
+
+# Add the project root to the Python path to enable importing the db/analytics packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from db.sql import faq_dedup
+from db.sql.faq_dedup import BANDS, NUM_PERM, ROWS_PER_BAND, cluster_near_duplicates
+
+BATTERY_ANSWER = (
+    "고전압 배터리를 오래 사용하려면 완전 방전을 피하고 "
+    "평소에는 80% 정도까지만 충전하는 것을 권장합니다. "
+    "장기간 운행하지 않을 때에는 충전기를 연결해 두십시오."
+)
+
+
+def test_near_duplicates_share_cluster():
+    texts = [
+        "배터리 관리 방법 " + BATTERY_ANSWER,
+        "충전 카드는 어떻게 발급받나요? 홈페이지에서 신청할 수 있습니다.",
+        "배터리 관리 요령 " + BATTERY_ANSWER + " 자세한 내용은 매뉴얼을 참고하세요.",
+    ]
+    assert cluster_near_duplicates(texts) == [0, 1, 0]
+
+
+def test_distinct_texts_stay_separate():
+    texts = [
+        "급속 충전기 사용 방법을 알려주세요.",
+        "차량 화재 발생 시 대처 요령은 무엇인가요?",
+        "보증 기간은 8년 16만km 입니다.",
+    ]
+    assert cluster_near_duplicates(texts) == [0, 1, 2]
+    assert cluster_near_duplicates([]) == []
+
+
+def test_bucket_members_compared_beyond_first(monkeypatch):
+    # a 는 b, c 와 첫 밴드에서만 우연히 충돌하고, b 와 c 는 다른 밴드마다 한 행씩만 다른 유사 중복입니다.
+    a = np.arange(NUM_PERM, dtype=np.uint64) + 1000
+    a[:ROWS_PER_BAND] = 0
+    b = np.arange(NUM_PERM, dtype=np.uint64) + 5000
+    b[:ROWS_PER_BAND] = 0
+    c = b.copy()
+    c[[band * ROWS_PER_BAND for band in range(1, BANDS)]] += 1
+    signatures = {'a': a, 'b': b, 'c': c}
+    monkeypatch.setattr(faq_dedup, 'minhash_signature', lambda text: signatures[text])
+    assert cluster_near_duplicates(['a', 'b', 'c']) == [0, 1, 1]
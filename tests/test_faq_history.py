@@ -0,0 +1,143 @@
+import sys
+import os
+import sqlite3
+
+# Add the project root to the Python path to enable importing the db/analytics packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from db.sql import faq_history
+from db.sql.create_tables import migrate_legacy_faq_table
+from db.sql.faq_history import (apply_delta, content_hash, faq_key, faqs_as_of, make_delta, rebuild_answer,
+                                sync_faqs)
+
+
+def test_delta_round_trip():
+    body = "차량의 충전 관리 설정을 확인하십시오. 예약 충전이 설정되어 있는 경우 즉시 충전이 되지 않습니다. " * 3
+    old = body + "완속 충전기는 약 7시간, 급속 충전기는 약 1시간이 소요됩니다."
+    new = body + "완속 충전기는 약 6시간, 급속 충전기는 약 40분이 소요됩니다. 자세한 내용은 매뉴얼을 참고하세요."
+    delta = make_delta(old, new)
+    assert apply_delta(old, delta) == new
+    assert len(delta) < len(new)
+
+
+def test_rebuild_answer_from_snapshot_and_deltas():
+    v1 = "배터리 보증 기간은 8년 16만km 입니다."
+    v2 = "배터리 보증 기간은 10년 20만km 입니다."
+    v3 = "고전압 배터리 보증 기간은 10년 20만km 입니다."
+    rows = [(v1, None), (None, make_delta(v1, v2)), (None, None), (None, make_delta(v2, v3))]
+    assert rebuild_answer(rows) == v3
+
+
+def test_keys_and_hashes_ignore_formatting():
+    assert faq_key('기아자동차', 'EV6 충전 방법은?') == faq_key('기아자동차', '  EV6  충전 방법은 ')
+    assert faq_key('기아자동차', 'EV6 충전 방법은?') != faq_key('기아자동차', 'EV6 충전 방법은?', occurrence=1)
+    assert content_hash('Q', '답변입니다.') == content_hash('Q', '답변입니다 ')
+    assert content_hash('Q', '답변입니다.') != content_hash('Q', '다른 답변입니다.')
+
+
+class SchemaCursor:
+    def __init__(self, columns):
+        self.columns = columns
+        self.statements = []
+
+    def execute(self, sql, params=()):
+        self.statements.append(' '.join(sql.split()))
+
+    def fetchall(self):
+        return [(column,) for column in self.columns]
+
+
+def test_legacy_faq_table_is_recreated():
+    legacy = SchemaCursor(['id', 'manufacturer_id', 'question', 'answer', 'captured_at', 'cluster_id'])
+    assert migrate_legacy_faq_table(legacy)
+    assert legacy.statements[-1] == "DROP TABLE ev_fire.EV_Manufacturer_FAQ"
+
+    current = SchemaCursor(['id', 'manufacturer_id', 'faq_key', 'question', 'answer', 'content_hash',
+                            'version', 'captured_at', 'cluster_id'])
+    assert not migrate_legacy_faq_table(current)
+    assert not migrate_legacy_faq_table(SchemaCursor([]))  # 새 DB: 테이블 없음
+
+
+# --- sync_faqs / faqs_as_of (SQLite 로 흉내 낸 MySQL 커서) ---
+HISTORY_SCHEMA = """
+CREATE TABLE EV_Manufacturer_FAQ (
+    id INTEGER PRIMARY KEY, manufacturer_id INTEGER, faq_key TEXT, question TEXT, answer TEXT,
+    content_hash TEXT, version INTEGER, captured_at TEXT
+);
+CREATE TABLE EV_FAQ_Version (
+    faq_key TEXT, version INTEGER, manufacturer_id INTEGER, change_type TEXT, question TEXT,
+    answer TEXT, delta TEXT, content_hash TEXT, captured_at TEXT, PRIMARY KEY (faq_key, version)
+);
+"""
+
+
+class HistoryCursor:
+    """%s 파라미터와 MOD() 를 지원하는 SQLite 커서. 실행한 문장을 기록합니다."""
+
+    def __init__(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.create_function('MOD', 2, lambda a, b: a % b)
+        self.conn.executescript(HISTORY_SCHEMA)
+        self.cursor = self.conn.cursor()
+        self.statements = []
+
+    def execute(self, sql, params=()):
+        self.statements.append(sql.split()[0].upper())
+        self.cursor.execute(sql.replace('%s', '?'), params)
+
+    def executemany(self, sql, rows):
+        self.statements.append(sql.split()[0].upper())
+        self.cursor.executemany(sql.replace('%s', '?'), rows)
+
+    def fetchall(self):
+        return self.cursor.fetchall()
+
+    def fetchone(self):
+        return self.cursor.fetchone()
+
+    def writes(self):
+        return [statement for statement in self.statements if statement != 'SELECT']
+
+    def versions(self):
+        self.cursor.execute("SELECT question, version, change_type FROM EV_FAQ_Version ORDER BY question, version")
+        return self.cursor.fetchall()
+
+
+def test_sync_faqs_records_only_changes():
+    cursor = HistoryCursor()
+    first = [("충전 시간은?", "완속 7시간, 급속 1시간입니다."), ("보증 기간은?", "8년 16만km 입니다.")]
+    assert sync_faqs(cursor, 1, '기아', first, '2025-01-01') == {'added': 2, 'modified': 0, 'removed': 0, 'unchanged': 0}
+    assert cursor.statements.count('SELECT') == 2  # 새 키마다 버전을 따로 조회하지 않음
+
+    cursor.statements = []
+    assert sync_faqs(cursor, 1, '기아', first, '2025-01-02')['unchanged'] == 2
+    assert cursor.writes() == []  # 내용이 같으면 아무것도 쓰지 않음
+
+    second = [("충전 시간은?", "완속 6시간, 급속 40분입니다."), ("침수 시 조치는?", "시동을 끄고 대피하십시오.")]
+    assert sync_faqs(cursor, 1, '기아', second, '2025-01-03') == {'added': 1, 'modified': 1, 'removed': 1, 'unchanged': 0}
+    # 사라졌던 FAQ가 다시 나타나면 이력의 다음 버전으로 이어집니다.
+    assert sync_faqs(cursor, 1, '기아', second + first[1:], '2025-01-04')['added'] == 1
+    assert cursor.versions() == [
+        ("보증 기간은?", 1, 'added'), ("보증 기간은?", 2, 'removed'), ("보증 기간은?", 3, 'added'),
+        ("충전 시간은?", 1, 'added'), ("충전 시간은?", 2, 'modified'),
+        ("침수 시 조치는?", 1, 'added'),
+    ]
+
+
+def test_faqs_as_of_rebuilds_across_snapshot_boundary(monkeypatch):
+    monkeypatch.setattr(faq_history, 'SNAPSHOT_INTERVAL', 3)
+    cursor = HistoryCursor()
+    answers = [f"배터리 보증은 {years}년입니다. 자세한 내용은 매뉴얼을 참고하세요." for years in range(8, 14)]
+    for day, answer in enumerate(answers, 1):
+        sync_faqs(cursor, 1, '기아', [("보증 기간은?", answer)], f"2025-01-0{day}")
+
+    cursor.cursor.execute("SELECT version FROM EV_FAQ_Version WHERE answer IS NOT NULL ORDER BY version")
+    assert [row[0] for row in cursor.fetchall()] == [1, 4]  # 1, 4 번째 버전만 전체 답변
+
+    for day, answer in enumerate(answers, 1):
+        [faq] = faqs_as_of(cursor, f"2025-01-0{day}")
+        assert (faq['version'], faq['answer']) == (day, answer)
+
+    sync_faqs(cursor, 1, '기아', [], '2025-01-09')
+    assert faqs_as_of(cursor, '2025-01-09') == []
+    assert faqs_as_of(cursor, '2025-01-08')[0]['answer'] == answers[-1]
@@ -0,0 +1,53 @@
+import sys
+import os
+
+import numpy as np
+import pandas as pd
+
+# Add the project root to the Python path to enable importing the db/analytics packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analytics.fire_rates import compute_damage_rates, compute_rates, fire_events_long, poisson_exact_interval
+
+
+def test_poisson_exact_interval_matches_reference_values():
+    lower, upper = poisson_exact_interval([0, 10])
+    np.testing.assert_allclose(lower, [0.0, 4.7954], atol=1e-4)
+    np.testing.assert_allclose(upper, [3.6889, 18.3904], atol=1e-4)
+
+
+def test_compute_rates_covers_every_breakdown():
+    total_fire_df = pd.DataFrame({'year': [2021], 'total_fires': [3517], 'general_road': [1734], 'tunnel': [15]})
+    ev_fire_df = pd.DataFrame({'year': [2021], 'total_fires': [24], 'total_casualties': [1],
+                               'deaths': [0], 'injuries': [1], 'property_damage_krw': [878084]})
+    reg_df = pd.DataFrame({'연도': [2021, 2021], '연료': ['ICE', 'EV'], '등록대수': [24678557, 231443]})
+
+    rates = compute_rates(fire_events_long(total_fire_df, ev_fire_df), reg_df)
+    assert len(rates) == 3 + 4
+    ev_fires = rates[(rates['연료'] == 'EV') & (rates['항목'] == '화재')].iloc[0]
+    assert np.isclose(ev_fires['발생률'], 24 / 231443 * 100000)
+    assert ev_fires['신뢰구간 하한'] < ev_fires['발생률'] < ev_fires['신뢰구간 상한']
+    assert ev_fires['부트스트랩 하한'] <= ev_fires['발생률'] <= ev_fires['부트스트랩 상한']
+
+    deaths = rates[rates['항목'] == '사망'].iloc[0]
+    assert deaths['발생률'] == 0 and deaths['신뢰구간 하한'] == 0 and deaths['신뢰구간 상한'] > 0
+
+    damage = compute_damage_rates(ev_fire_df, reg_df)
+    assert damage['부트스트랩 하한'].iloc[0] < damage['10만대당 피해액'].iloc[0] < damage['부트스트랩 상한'].iloc[0]
+
+
+def test_zero_count_cells_leave_bootstrap_empty():
+    total_fire_df = pd.DataFrame({'year': [2021], 'total_fires': [3517]})
+    ev_fire_df = pd.DataFrame({'year': [2021, 2022], 'total_fires': [24, 0], 'total_casualties': [1, 0],
+                               'deaths': [0, 0], 'injuries': [1, 0], 'property_damage_krw': [878084, 0]})
+    reg_df = pd.DataFrame({'연도': [2021, 2021, 2022], '연료': ['ICE', 'EV', 'EV'],
+                           '등록대수': [24678557, 231443, 389855]})
+
+    rates = compute_rates(fire_events_long(total_fire_df, ev_fire_df), reg_df)
+    deaths = rates[rates['항목'] == '사망'].iloc[0]
+    assert np.isnan(deaths['부트스트랩 하한']) and np.isnan(deaths['부트스트랩 상한'])
+    assert deaths['신뢰구간 상한'] > 0
+
+    damage = compute_damage_rates(ev_fire_df, reg_df).set_index('연도')
+    assert damage.loc[2022, ['부트스트랩 하한', '부트스트랩 상한']].isna().all()
+    assert damage.loc[2021, ['부트스트랩 하한', '부트스트랩 상한']].notna().all()
@@ -0,0 +1,64 @@
+import ast
+import glob
+import json
+import os
+import subprocess
+import sys
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+PAGES = glob.glob(os.path.join(ROOT_DIR, 'pages', '*.py')) + [os.path.join(ROOT_DIR, 'home.py')]
+
+# Project modules imported at the top of the Streamlit pages
+PAGE_MODULES = ['db.connection', 'analytics.fire_data', 'analytics.fire_rates', 'search.autocomplete', 'search.facets']
+# Of those, the modules that work on DataFrames and may import pandas at module level
+DATAFRAME_MODULES = {'analytics.fire_data', 'analytics.fire_rates'}
+# Dependencies that must only be imported on first use
+LAZY_MODULES = ['pandas', 'mysql', 'altair', 'scipy', 'matplotlib', 'bokeh', 'selenium']
+# Allowed module-level imports in the page scripts
+PAGE_TOP_LEVEL_IMPORTS = {'streamlit', 'pandas', 'db', 'analytics', 'search'}
+
+
+def _loaded_lazy_modules(import_lines):
+    """Run the import lines in a fresh interpreter and return the LAZY_MODULES it ended up loading."""
+    code = (
+        "import json, sys\n"
+        + "".join(f"{line}\n" for line in import_lines)
+        + f"print(json.dumps(sorted(m for m in {LAZY_MODULES!r} if m in sys.modules)))\n"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIR, capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def _top_level_imports(page):
+    with open(page, encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+
+
+def _imported_names(node):
+    if isinstance(node, ast.Import):
+        return [alias.name for alias in node.names]
+    return [node.module or '']
+
+
+def test_page_modules_defer_heavy_dependencies():
+    for module in PAGE_MODULES:
+        allowed = ['pandas'] if module in DATAFRAME_MODULES else []
+        assert _loaded_lazy_modules([f"import {module}"]) == allowed, module
+
+
+def test_page_imports_defer_heavy_dependencies():
+    # Streamlit itself is left out so this also runs where it is not installed.
+    for page in PAGES:
+        nodes = [node for node in _top_level_imports(page)
+                 if not any(name.split('.')[0] == 'streamlit' for name in _imported_names(node))]
+        own = {name.split('.')[0] for node in nodes for name in _imported_names(node)}
+        loaded = _loaded_lazy_modules([ast.unparse(node) for node in nodes])
+        assert set(loaded) <= own, f"{os.path.basename(page)} loads {loaded} at import"
+
+
+def test_pages_only_import_light_modules_at_top_level():
+    for page in PAGES:
+        for node in _top_level_imports(page):
+            for name in _imported_names(node):
+                assert name.split('.')[0] in PAGE_TOP_LEVEL_IMPORTS, f"{os.path.basename(page)} imports {name}"
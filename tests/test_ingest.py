@@ -0,0 +1,75 @@
+import sys
+import os
+
+# Add the project root to the Python path to enable importing the db/analytics packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from db.ingest import Stage, run_pipeline, select_stages
+
+
+def make_stages(tmp_path, calls, fail=()):
+    source = tmp_path / 'source.csv'
+    if not source.exists():
+        source.write_text('year,count\n2021,1\n', encoding='utf-8')
+
+    def runner(name):
+        def run():
+            calls.append(name)
+            if name in fail:
+                raise RuntimeError(name)
+        return run
+
+    return [
+        Stage('create', runner('create')),
+        Stage('load_a', runner('load_a'), inputs=[str(source)], deps=['create']),
+        Stage('load_b', runner('load_b'), deps=['create']),
+        Stage('report', runner('report'), deps=['load_a', 'load_b']),
+    ]
+
+
+def test_pipeline_resumes_and_skips_unchanged(tmp_path):
+    checkpoint = str(tmp_path / 'checkpoints.json')
+
+    calls = []
+    status = run_pipeline(make_stages(tmp_path, calls, fail={'load_b'}), checkpoint_path=checkpoint)
+    assert status == {'create': 'done', 'load_a': 'done', 'load_b': 'failed', 'report': 'blocked'}
+
+    # 실패 이후 재실행: 완료된 스테이지는 건너뛰고 실패 지점부터 이어서 실행
+    calls = []
+    status = run_pipeline(make_stages(tmp_path, calls), checkpoint_path=checkpoint)
+    assert sorted(calls) == ['load_b', 'report']
+    assert status['create'] == 'skipped' and status['report'] == 'done'
+
+    # 입력 파일이 바뀌면 해당 스테이지와 후행 스테이지만 다시 실행
+    (tmp_path / 'source.csv').write_text('year,count\n2021,2\n', encoding='utf-8')
+    calls = []
+    run_pipeline(make_stages(tmp_path, calls), checkpoint_path=checkpoint)
+    assert sorted(calls) == ['load_a', 'report']
+
+
+def test_select_stages_pulls_in_dependencies(tmp_path):
+    stages = select_stages(make_stages(tmp_path, []), only=['load_a'])
+    assert [s.name for s in stages] == ['create', 'load_a']
+
+
+def test_always_run_stage_ignores_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / 'checkpoints.json')
+    scraped = tmp_path / 'scraped.json'
+
+    def make(calls):
+        def scrape():
+            calls.append('scrape')
+            scraped.write_text('[]', encoding='utf-8')
+        return [
+            Stage('scrape', scrape, always_run=True),
+            Stage('load', lambda: calls.append('load'), inputs=[str(scraped)], deps=['scrape']),
+        ]
+
+    calls = []
+    run_pipeline(make(calls), checkpoint_path=checkpoint)
+    assert calls == ['scrape', 'load']
+
+    # 스크래퍼는 다시 실행하지만, 스크랩 결과가 같으면 후행 스테이지는 건너뜀
+    calls = []
+    status = run_pipeline(select_stages(make(calls)), checkpoint_path=checkpoint)
+    assert calls == ['scrape'] and status == {'scrape': 'done', 'load': 'skipped'}
@@ -0,0 +1,89 @@
+import sys
+import os
+
+import pandas as pd
+
+# Add the project root to the Python path to enable importing the db/analytics packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from db.sql import typed_csv
+from db.sql.load_csv_data import detect_period_columns, load_vehicle_registrations, melt_registrations
+from db.sql.typed_csv import FIRE_INCIDENT_SCHEMA, read_typed_csv, to_db_rows
+
+
+class RecordingCursor:
+    def __init__(self):
+        self.rows = []
+
+    def executemany(self, sql, rows):
+        self.rows.extend(rows)
+
+
+def test_detect_period_columns():
+    columns = ['ID', '연료', '2021', '2022-03', '2022.12', '202301', '2023년 2월', '2023-13', 'source_url']
+    assert detect_period_columns(columns) == {
+        '2021': (2021, 0),
+        '2022-03': (2022, 3),
+        '2022.12': (2022, 12),
+        '202301': (2023, 1),
+        '2023년 2월': (2023, 2),
+    }
+
+
+def test_melt_registrations_wide_to_long():
+    chunk = pd.DataFrame({
+        '지역': ['서울', '부산'],
+        '연료별': ['전기', '수소'],
+        '2024-01': [100.0, 5.0],
+        '2024-02': [110.0, None],
+    })
+    long_df = melt_registrations(chunk, detect_period_columns(chunk.columns), '연료별', '지역')
+    assert sorted(long_df.itertuples(index=False, name=None)) == [
+        (2024, 1, 'EV', '서울', 100, None),
+        (2024, 1, 'HYDROGEN', '부산', 5, None),
+        (2024, 2, 'EV', '서울', 110, None),
+    ]
+
+
+def test_melt_registrations_maps_fuel_aliases_case_insensitively():
+    chunk = pd.DataFrame({'fuel': [' Hybrid ', 'HYDROGEN', 'LPG'], '2024': [1, 2, 3]})
+    long_df = melt_registrations(chunk, detect_period_columns(chunk.columns), 'fuel')
+    assert list(long_df['fuel_type']) == ['HYBRID', 'HYDROGEN', 'LPG']
+
+
+def test_load_vehicle_registrations_streams_chunks(tmp_path):
+    file_path = tmp_path / 'Vehicles_monthly.csv'
+    file_path.write_text('연료,2024-01,2024-02\nEV,"1,000",1100\nICE,"25,000,000","25,010,000"\n', encoding='utf-8')
+
+    cursor = RecordingCursor()
+    load_vehicle_registrations(cursor, [str(file_path)], chunksize=1)
+    assert sorted(cursor.rows) == [
+        (2024, 1, 'EV', '전국', 1000, None),
+        (2024, 1, 'ICE', '전국', 25000000, None),
+        (2024, 2, 'EV', '전국', 1100, None),
+        (2024, 2, 'ICE', '전국', 25010000, None),
+    ]
+
+
+def test_read_typed_csv_parses_and_rejects(tmp_path, monkeypatch):
+    monkeypatch.setattr(typed_csv, 'REJECTED_PATH', str(tmp_path / 'rejected'))
+    file_path = tmp_path / FIRE_INCIDENT_SCHEMA.file_name
+    file_path.write_text(
+        '\ufeff구분,화재(건),일반도로,고속도로,기타도로,주차장,공지,터널\n'
+        '계,"10,933","5,266","2,161",531,"2,024",887,64\n'
+        '2021,"3,517","1,734",685,178,634,271,15\n'
+        '2022,-,"1,739",727,181,700,307,26\n'
+        '미상,"3,736",1793,749,172,690,309,23\n'
+        '2023,"3,736",1793,749,172,690,,23\n',
+        encoding='utf-8',
+    )
+
+    df, rejected = read_typed_csv(str(file_path), FIRE_INCIDENT_SCHEMA, chunksize=2)
+    assert rejected == 2
+    assert to_db_rows(df) == [
+        (2021, 3517, 1734, 685, 178, 634, 271, 15),
+        (2023, 3736, 1793, 749, 172, 690, None, 23),
+    ]
+
+    rejects = (tmp_path / 'rejected' / '소방청_차량화재통계.rejected.csv').read_text(encoding='utf-8-sig')
+    assert 'missing total_fires' in rejects and 'invalid year' in rejects
@@ -0,0 +1,66 @@
+import sys
+import os
+import time
+
+import pytest
+
+# Add the project root to the Python path to enable importing the loadtest package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from analytics import fire_data
+from analytics.fire_rates import calculate_fire_rates_per_registration
+from db import connection as db
+from loadtest.run import latency_summary, run_load_test
+from loadtest.stand_in_db import StandInDatabase
+
+
+def test_stand_in_database_serves_page_queries_and_counts_connections():
+    with StandInDatabase(faq_count=50) as database:
+        first, second = db.get_connection(), db.get_connection()
+        cursor = first.cursor(dictionary=True)
+        rates = calculate_fire_rates_per_registration(fire_data.load_registrations(cursor),
+                                                      fire_data.load_fire_counts(cursor))
+        cursor.execute("SELECT COUNT(*) AS n FROM EV_Manufacturer_FAQ WHERE id > %s", (10,))
+        assert cursor.fetchone() == {'n': 40}
+        first.close()
+        second.close()
+        first.close()
+
+    assert len(rates) == 20 and (rates['화재율'] > 0).all()
+    assert (database.peak_connections, database.total_connections, database.open_connections) == (2, 2, 0)
+    assert db.get_connection is not database.connect
+
+
+def test_latency_summary_percentiles():
+    summary = latency_summary([i / 1000 for i in range(1, 101)])
+    assert summary['runs'] == 100
+    assert round(summary['p50']) == 50 and round(summary['p99']) == 99 and summary['max'] == 100
+
+
+def hold_connection_session(page, reruns, start_barrier, session_no):
+    """프로세스 배관 확인용 세션: 연결을 연 채로 모두가 모일 때까지 기다렸다가 닫습니다."""
+    conn = db.get_connection()
+    start_barrier.wait()
+    cursor = conn.cursor(dictionary=True)
+    started = time.perf_counter()
+    cursor.execute("SELECT COUNT(*) AS n FROM EV_Manufacturer_FAQ")
+    latencies = [time.perf_counter() - started]
+    errors = [] if cursor.fetchone() == {'n': 20} else ["FAQ 개수가 다릅니다"]
+    conn.close()
+    return object(), latencies, errors
+
+
+def test_run_load_test_counts_connections_across_processes():
+    report = run_load_test(users=3, pages=('home', 'faq'), reruns=0, faq_count=20, db_latency_ms=0,
+                           session=hold_connection_session)
+    assert (report['peak_connections_across_processes'], report['total_connections'], report['leaked_connections']) == (3, 3, 0)
+    assert report['pages']['home']['runs'] == 2 and report['pages']['faq']['runs'] == 1
+    assert report['pages']['home']['errors'] == [] and report['pages']['faq']['errors'] == []
+
+
+def test_run_load_test_with_streamlit_sessions():
+    pytest.importorskip('streamlit')
+    report = run_load_test(users=2, pages=('faq',), reruns=1, faq_count=50, db_latency_ms=0)
+    assert report['pages']['faq']['runs'] == 4
+    assert report['pages']['faq']['errors'] == []
+    assert report['leaked_connections'] == 0 and report['peak_connections_across_processes'] >= 1
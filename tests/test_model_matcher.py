@@ -0,0 +1,67 @@
+import sys
+import os
+
+# Add the project root to the Python path to enable importing the db/analytics packages
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from db.sql.model_matcher import (
+    AhoCorasick, build_manufacturer_matcher, build_model_matcher, normalize, read_alias_rules, tag_texts
+)
+
+
+def test_aho_corasick_overlapping_patterns():
+    matcher = AhoCorasick()
+    for pattern in ['he', 'she', 'his', 'hers']:
+        matcher.add(pattern, pattern)
+    matches = list(matcher.iter_matches('ushers'))
+    assert matches == [(3, 'she'), (3, 'he'), (5, 'hers')]
+
+
+def test_model_tagging_uses_aliases():
+    models = [
+        (1, '테슬라', '테슬라 모델 Y'),
+        (2, '쉐보레', '볼트 EV'),
+        (3, '현대자동차', '코나EV(~22년형)'),
+        (4, '기아자동차', 'EV'),
+    ]
+    matcher = build_model_matcher(models)
+    tags = tag_texts(matcher, [
+        'Model Y 은(는) 배터리 시스템을 가지고 있습니다.',
+        '볼트EV/EUV 고전압 배터리 리콜',
+        '코나 EV 충전 방법',
+        'EV 충전 카드 발급',
+    ])
+    assert tags == [{1}, {2}, {3}, set()]
+
+
+def test_manufacturer_from_filename():
+    matcher = build_manufacturer_matcher(['쉐보레', '기아자동차', '테슬라'])
+    assert matcher.find_all(normalize('chevrolet_ev_faq')) == {'쉐보레'}
+    assert matcher.find_all(normalize('kia_ev_faq')) == {'기아자동차'}
+    assert matcher.find_all(normalize('unknown_faq')) == set()
+
+
+def test_model_tagging_respects_word_boundaries_and_ambiguous_aliases():
+    models = [
+        (1, '쉐보레', '스파크'),
+        (2, '닛산', '닛산 리프'),
+        (3, 'Evion', 'E6'),
+        (4, 'BMW', 'BMW XM'),
+    ]
+    rules = {'stopword': set(), 'ambiguous': {'스파크', '리프'}}
+    matcher = build_model_matcher(models, rules)
+    tags = tag_texts(matcher, [
+        '충전 커넥터에서 스파크가 발생하면',
+        '정비소 리프트에 차량을 올릴 때',
+        'Type 6 커넥터',
+        'XML 파일',
+        '쉐보레 스파크 EV 배터리 교체',
+        '닛산 리프 충전 / BMW XM, E6 모델',
+    ])
+    assert tags == [set(), set(), set(), set(), {1}, {2, 3, 4}]
+
+
+def test_alias_rules_file():
+    rules = read_alias_rules()
+    assert {'다니고', '피스', '리노'} <= rules['stopword']
+    assert {'스파크', '리프'} <= rules['ambiguous']
@@ -0,0 +1,95 @@
+import sys
+import os
+import json
+
+from pypdf import PdfWriter
+from pypdf.generic import DecodedStreamObject, DictionaryObject, NameObject
+
+# Add the project root to the Python path to enable importing the collection package
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from collection.pdf_faq_extractor import clean_line, clean_lines, extract_pages, extract_pdf_to_jsonl, segment_faqs
+
+
+def test_clean_line_strips_stray_characters_and_bullets():
+    assert clean_line("\u2022 \ue001충전\u200b 케이블을   분리하십시오.\ufffd") == "충전 케이블을 분리하십시오."
+
+
+def test_clean_lines_drops_page_numbers():
+    pages = [(0, "- 12 -\n배터리 관리\n\n3 / 40\n")]
+    assert list(clean_lines(pages)) == [(0, "배터리 관리")]
+
+
+def test_segment_faqs_splits_questions_and_answers():
+    pages = [
+        (0, "Q. 충전 중에 차량을 사용할 수 있나요?\nA. 충전 중에는 주행할 수 없으며,\n공조 장치는 사용할 수 있습니다.\n"),
+        (1, "배터리 보증\n고전압 배터리는 8년 또는 16만km까지 보증됩니다.\n짧은 제목\n짧음.\n"),
+    ]
+    faqs = list(segment_faqs(clean_lines(pages), rules={'headings_as_questions': True}))
+    assert faqs == [
+        {'question': "충전 중에 차량을 사용할 수 있나요?",
+         'answer': "충전 중에는 주행할 수 없으며, 공조 장치는 사용할 수 있습니다.", 'page': 1},
+        {'question': "배터리 보증", 'answer': "고전압 배터리는 8년 또는 16만km까지 보증됩니다.", 'page': 2},
+    ]
+
+
+WRAPPED_PAGE = (0, "배터리 충전\n"
+                   "차량을 장기간 주차할 때에는 고전압\n"
+                   "배터리의 충전량을 50~80% 수준으로\n"
+                   "유지하는 것이 좋습니다.\n"
+                   "충전 케이블 보관\n"
+                   "케이블은 직사광선을 피해 건조한 곳에\n"
+                   "보관하십시오.\n")
+
+
+def test_segment_faqs_keeps_wrapped_answer_lines_together():
+    faqs = list(segment_faqs(clean_lines([WRAPPED_PAGE]), rules={'headings_as_questions': True}))
+    assert faqs == [
+        {'question': "배터리 충전",
+         'answer': "차량을 장기간 주차할 때에는 고전압 배터리의 충전량을 50~80% 수준으로 유지하는 것이 좋습니다.",
+         'page': 1},
+        {'question': "충전 케이블 보관", 'answer': "케이블은 직사광선을 피해 건조한 곳에 보관하십시오.", 'page': 1},
+    ]
+
+
+def test_segment_faqs_ignores_headings_by_default():
+    assert list(segment_faqs(clean_lines([WRAPPED_PAGE]))) == []
+
+
+def _write_pdf(path, page_lines):
+    """페이지마다 줄 목록을 Helvetica 텍스트로 쓴 PDF를 만듭니다."""
+    writer = PdfWriter()
+    for lines in page_lines:
+        page = writer.add_blank_page(width=595, height=842)
+        font = DictionaryObject({
+            NameObject('/Type'): NameObject('/Font'),
+            NameObject('/Subtype'): NameObject('/Type1'),
+            NameObject('/BaseFont'): NameObject('/Helvetica'),
+        })
+        page[NameObject('/Resources')] = DictionaryObject({
+            NameObject('/Font'): DictionaryObject({NameObject('/F1'): font}),
+        })
+        text = ''.join(f"({line}) Tj 0 -20 Td " for line in lines)
+        content = DecodedStreamObject()
+        content.set_data(f"BT /F1 12 Tf 50 780 Td {text}ET".encode('latin-1'))
+        page.replace_contents(content)
+    with open(path, 'wb') as f:
+        writer.write(f)
+
+
+def test_extract_pages_in_process_pool_keeps_page_order(tmp_path):
+    pdf_path = str(tmp_path / 'manual.pdf')
+    _write_pdf(pdf_path, [[f"Q. How do I use feature {n}?", f"A. Feature {n} is described on page {n + 1}."]
+                          for n in range(7)])
+
+    pages = extract_pages(pdf_path, max_workers=3, pages_per_task=2)
+    assert [page_no for page_no, _ in pages] == list(range(7))
+    assert all(f"feature {n}?" in text for n, (_, text) in enumerate(pages))
+
+    out_path = str(tmp_path / 'manual.jsonl')
+    assert extract_pdf_to_jsonl(pdf_path, out_path, max_workers=3, pages_per_task=2) == 7
+    with open(out_path, encoding='utf-8') as f:
+        faqs = [json.loads(line) for line in f]
+    assert [faq['page'] for faq in faqs] == list(range(1, 8))
+    assert faqs[4] == {'question': "How do I use feature 4?", 'answer': "Feature 4 is described on page 5.",
+                       'page': 5, 'source': 'manual.pdf'}